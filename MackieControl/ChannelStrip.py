@@ -6,9 +6,31 @@
 # Size of source mod 2**32: 23418 bytes
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import range
+from functools import partial
 from itertools import chain
 from ableton.v2.base import liveobj_valid
 from .MackieControlComponent import *
+CHANNEL_STRIP_SWITCH_BASES = (
+ SID_RECORD_ARM_BASE, SID_SOLO_BASE, SID_MUTE_BASE, SID_SELECT_BASE, SID_VPOD_PUSH_BASE,
+ SID_FADER_TOUCH_SENSE_BASE)
+
+def channel_strip_switch_handlers(channel_strips):
+    handlers = {}
+    for sw_id in chain(channel_strip_switch_ids, fader_touch_switch_ids):
+        owners = channel_strips
+        for base in CHANNEL_STRIP_SWITCH_BASES:
+            if base <= sw_id < base + len(channel_strips):
+                owners = [channel_strips[sw_id - base]]
+                break
+
+        handlers.setdefault(sw_id, []).extend([s.handle_channel_strip_switch_ids for s in owners])
+
+    return handlers
+
+
+def channel_strip_vpot_handlers(channel_strips):
+    return dict(((FID_PANNING_BASE + index, partial(s.handle_vpot_rotation, index)) for index, s in enumerate(channel_strips)))
+
 
 class ChannelStrip(MackieControlComponent):
 
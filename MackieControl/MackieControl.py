@@ -7,7 +7,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import object, range
 import Live, MidiRemoteScript
-from .ChannelStrip import ChannelStrip, MasterChannelStrip
+from .ChannelStrip import ChannelStrip, MasterChannelStrip, channel_strip_switch_handlers, channel_strip_vpot_handlers
 from .ChannelStripController import ChannelStripController
 from .consts import *
 from .MainDisplay import MainDisplay
@@ -46,6 +46,29 @@ class MackieControl(object):
         self.is_pro_version = False
         self._received_firmware_version = False
         self._refresh_state_next_time = 0
+        self._MackieControl__build_midi_dispatch_tables()
+
+    def __build_midi_dispatch_tables(self):
+        note_handlers = {}
+
+        def add_note_handlers(switch_ids, handler):
+            for sw_id in switch_ids:
+                note_handlers.setdefault(sw_id, []).append(handler)
+
+        add_note_handlers(display_switch_ids, self._MackieControl__handle_display_switch_ids)
+        for sw_id, handlers in channel_strip_switch_handlers(self._MackieControl__channel_strips).items():
+            note_handlers.setdefault(sw_id, []).extend(handlers)
+
+        add_note_handlers(channel_strip_control_switch_ids, self._MackieControl__channel_strip_controller.handle_assignment_switch_ids)
+        add_note_handlers(function_key_control_switch_ids, self._MackieControl__software_controller.handle_function_key_switch_ids)
+        add_note_handlers(software_controls_switch_ids, self._MackieControl__software_controller.handle_software_controls_switch_ids)
+        add_note_handlers(transport_control_switch_ids, self._MackieControl__transport.handle_transport_switch_ids)
+        add_note_handlers(marker_control_switch_ids, self._MackieControl__transport.handle_marker_switch_ids)
+        add_note_handlers(jog_wheel_switch_ids, self._MackieControl__transport.handle_jog_wheel_switch_ids)
+        self._MackieControl__note_handlers = dict(((sw_id, tuple(handlers)) for sw_id, handlers in note_handlers.items() if SID_FIRST <= sw_id <= SID_LAST))
+        cc_handlers = channel_strip_vpot_handlers(self._MackieControl__channel_strips)
+        cc_handlers[JOG_WHEEL_CC_NO] = self._MackieControl__transport.handle_jog_wheel_rotation
+        self._MackieControl__cc_handlers = cc_handlers
 
     def disconnect(self):
         for c in self._MackieControl__components:
@@ -119,37 +142,19 @@ class MackieControl(object):
         self._MackieControl__c_instance.send_midi(midi_event_bytes)
 
     def receive_midi(self, midi_bytes):
-        if midi_bytes[0] & 240 == NOTE_ON_STATUS or midi_bytes[0] & 240 == NOTE_OFF_STATUS:
+        status = midi_bytes[0] & 240
+        if status == NOTE_ON_STATUS or status == NOTE_OFF_STATUS:
             note = midi_bytes[1]
-            value = BUTTON_PRESSED if midi_bytes[2] > 0 else BUTTON_RELEASED
-            if note in range(SID_FIRST, SID_LAST + 1):
-                if note in display_switch_ids:
-                    self._MackieControl__handle_display_switch_ids(note, value)
-                if note in channel_strip_switch_ids + fader_touch_switch_ids:
-                    for s in self._MackieControl__channel_strips:
-                        s.handle_channel_strip_switch_ids(note, value)
-
-                if note in channel_strip_control_switch_ids:
-                    self._MackieControl__channel_strip_controller.handle_assignment_switch_ids(note, value)
-                if note in function_key_control_switch_ids:
-                    self._MackieControl__software_controller.handle_function_key_switch_ids(note, value)
-                if note in software_controls_switch_ids:
-                    self._MackieControl__software_controller.handle_software_controls_switch_ids(note, value)
-                if note in transport_control_switch_ids:
-                    self._MackieControl__transport.handle_transport_switch_ids(note, value)
-                if note in marker_control_switch_ids:
-                    self._MackieControl__transport.handle_marker_switch_ids(note, value)
-                if note in jog_wheel_switch_ids:
-                    self._MackieControl__transport.handle_jog_wheel_switch_ids(note, value)
-            elif midi_bytes[0] & 240 == CC_STATUS:
-                cc_no = midi_bytes[1]
-                cc_value = midi_bytes[2]
-                if cc_no == JOG_WHEEL_CC_NO:
-                    self._MackieControl__transport.handle_jog_wheel_rotation(cc_value)
-            elif cc_no in range(FID_PANNING_BASE, FID_PANNING_BASE + NUM_CHANNEL_STRIPS):
-                for s in self._MackieControl__channel_strips:
-                    s.handle_vpot_rotation(cc_no - FID_PANNING_BASE, cc_value)
-
+            handlers = self._MackieControl__note_handlers.get(note)
+            if handlers:
+                value = BUTTON_PRESSED if midi_bytes[2] > 0 else BUTTON_RELEASED
+                for handler in handlers:
+                    handler(note, value)
+
+        elif status == CC_STATUS:
+            handler = self._MackieControl__cc_handlers.get(midi_bytes[1])
+            if handler is not None:
+                handler(midi_bytes[2])
         else:
             if midi_bytes[0] == 240:
                 if len(midi_bytes) == 12:
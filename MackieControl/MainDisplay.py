@@ -7,13 +7,26 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from ableton.v3.base import as_ascii
 from .MackieControlComponent import *
+DISPLAY_SYSEX_OVERHEAD = 8
+
+def changed_runs(old_chars, new_chars, max_gap):
+    runs = []
+    for index, (old_char, new_char) in enumerate(zip(old_chars, new_chars)):
+        if old_char != new_char:
+            if runs and index - runs[-1][1] <= max_gap:
+                runs[-1][1] = index + 1
+            else:
+                runs.append([index, index + 1])
+
+    return runs
+
 
 class MainDisplay(MackieControlComponent):
 
     def __init__(self, main_script):
         MackieControlComponent.__init__(self, main_script)
         self._MainDisplay__stack_offset = 0
-        self._MainDisplay__last_send_messages = [[], []]
+        self._MainDisplay__last_send_messages = [(None, []), (None, [])]
 
     def destroy(self):
         NUM_CHARS_PER_DISPLAY_LINE = 54
@@ -36,19 +49,29 @@ class MainDisplay(MackieControlComponent):
             if display_row == 1:
                 offset = NUM_CHARS_PER_DISPLAY_LINE + 2 + cursor_offset
             else:
-                message_string = as_ascii(display_string)
-                if self._MainDisplay__last_send_messages[display_row] != message_string:
-                    self._MainDisplay__last_send_messages[display_row] = message_string
-                    if self.main_script().is_extension():
-                        device_type = SYSEX_DEVICE_TYPE_XT
-                    else:
-                        device_type = SYSEX_DEVICE_TYPE
-                    display_sysex = (
-                     240, 0, 0, 102, device_type, 18, offset) + tuple(message_string) + (247, )
-                    self.send_midi(display_sysex)
+                return
+        message_string = as_ascii(display_string)
+        last_cursor_offset, last_message = self._MainDisplay__last_send_messages[display_row]
+        if last_message != message_string:
+            self._MainDisplay__last_send_messages[display_row] = (cursor_offset, message_string)
+            if last_cursor_offset == cursor_offset and len(last_message) == len(message_string):
+                runs = changed_runs(last_message, message_string, DISPLAY_SYSEX_OVERHEAD)
+            else:
+                runs = [(0, len(message_string))]
+            for start, end in runs:
+                self._MainDisplay__send_display_sysex(offset + start, message_string[start:end])
+
+    def __send_display_sysex(self, offset, chars):
+        if self.main_script().is_extension():
+            device_type = SYSEX_DEVICE_TYPE_XT
+        else:
+            device_type = SYSEX_DEVICE_TYPE
+        display_sysex = (
+         240, 0, 0, 102, device_type, 18, offset) + tuple(chars) + (247, )
+        self.send_midi(display_sysex)
 
     def refresh_state(self):
-        self._MainDisplay__last_send_messages = [[], []]
+        self._MainDisplay__last_send_messages = [(None, []), (None, [])]
 
     def on_update_display_timer(self):
         pass
@@ -8,6 +8,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 from builtins import object, range
 import Live
 import MackieControl.ChannelStrip as ChannelStrip
+from MackieControl.ChannelStrip import channel_strip_switch_handlers, channel_strip_vpot_handlers
 from MackieControl.consts import *
 import MackieControl.MainDisplay as MainDisplay
 
@@ -26,6 +27,8 @@ class MackieControlXT(object):
         self.is_pro_version = False
         self._received_firmware_version = False
         self._refresh_state_next_time = 0
+        self._MackieControlXT__note_handlers = channel_strip_switch_handlers(self._MackieControlXT__channel_strips)
+        self._MackieControlXT__cc_handlers = channel_strip_vpot_handlers(self._MackieControlXT__channel_strips)
 
     def disconnect(self):
         for c in self._MackieControlXT__components:
@@ -119,22 +122,20 @@ class MackieControlXT(object):
         self._MackieControlXT__c_instance.send_midi(midi_event_bytes)
 
     def receive_midi(self, midi_bytes):
-        if midi_bytes[0] & 240 == NOTE_ON_STATUS or midi_bytes[0] & 240 == NOTE_OFF_STATUS:
+        status = midi_bytes[0] & 240
+        if status == NOTE_ON_STATUS or status == NOTE_OFF_STATUS:
             note = midi_bytes[1]
-            value = BUTTON_PRESSED if midi_bytes[2] > 0 else BUTTON_RELEASED
-            if note in range(SID_FIRST, SID_LAST + 1):
-                if note in channel_strip_switch_ids + fader_touch_switch_ids:
-                    for s in self._MackieControlXT__channel_strips:
-                        s.handle_channel_strip_switch_ids(note, value)
+            handlers = self._MackieControlXT__note_handlers.get(note)
+            if handlers:
+                value = BUTTON_PRESSED if midi_bytes[2] > 0 else BUTTON_RELEASED
+                for handler in handlers:
+                    handler(note, value)
 
         else:
-            if midi_bytes[0] & 240 == CC_STATUS:
-                cc_no = midi_bytes[1]
-                cc_value = midi_bytes[2]
-                if cc_no in range(FID_PANNING_BASE, FID_PANNING_BASE + NUM_CHANNEL_STRIPS):
-                    for s in self._MackieControlXT__channel_strips:
-                        s.handle_vpot_rotation(cc_no - FID_PANNING_BASE, cc_value)
-
+            if status == CC_STATUS:
+                handler = self._MackieControlXT__cc_handlers.get(midi_bytes[1])
+                if handler is not None:
+                    handler(midi_bytes[2])
             else:
                 if midi_bytes[0] == 240:
                     if len(midi_bytes) == 12:
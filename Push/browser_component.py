@@ -11,7 +11,7 @@ from past.utils import old_div
 import re
 from functools import partial
 import Live
-from ableton.v2.base import clamp, find_if, listens, listens_group, memoize, nop, task
+from ableton.v2.base import bounded_memoize, clamp, find_if, listens, listens_group, nop, task
 from ableton.v2.control_surface import Component
 from ableton.v2.control_surface.control import ButtonControl, ToggleButtonControl
 from ableton.v2.control_surface.elements import DisplayDataSource
@@ -29,7 +29,7 @@ def make_stem_cleaner(stem):
     return nop
 
 
-@memoize
+@bounded_memoize(256)
 def _memoized_stem_cleaner(stem):
     ellipsis = consts.CHAR_ELLIPSIS
     stem = re.escape(stem)
@@ -18,6 +18,7 @@ from pushbase.consts import MessageBoxText
 from pushbase.message_box_component import Messenger
 from .browser_item import BrowserItem, ProxyBrowserItem
 from .browser_list import BrowserList
+from .browser_search import BrowserSearchIndex
 from .colors import DISPLAY_BUTTON_SHADE_LEVEL, IndexedColor
 NAVIGATION_COLORS = dict(color="Browser.Navigation",
   disabled_color="Browser.NavigationDisabled")
@@ -167,6 +168,8 @@ class BrowserComponent(Component, Messenger):
           is_enabled=False)
         self._content_filter_type = None
         self._content_hotswap_target = None
+        self._search_index = None
+        self._search_index_content = (None, None)
         self._preview_list_task = self._tasks.add(task.sequence(task.wait(self.REVEAL_PREVIEW_LIST_TIME), task.run(self._replace_preview_list_by_task))).kill()
         self._update_root_items()
         self._update_navigation_buttons()
@@ -683,7 +686,8 @@ class BrowserComponent(Component, Messenger):
     def _append_browser_list(self, children_iterator, limit=-1, enable_wrapping=True):
         l = BrowserList(item_iterator=children_iterator,
           item_wrapper=(self._wrap_item if enable_wrapping else nop),
-          limit=limit)
+          limit=limit,
+          tasks=(self._tasks))
         l.items_wrapped = enable_wrapping
         self._lists.append(l)
         self.register_disconnectable(l)
@@ -693,6 +697,7 @@ class BrowserComponent(Component, Messenger):
         num_items_to_crop = len(self._lists) - length
         for _ in range(num_items_to_crop):
             l = self._lists.pop()
+            l.stop_materializing()
             self.unregister_disconnectable(l)
 
         if num_items_to_crop > 0:
@@ -717,6 +722,34 @@ class BrowserComponent(Component, Messenger):
         self._content_filter_type = self._browser.filter_type
         self._content_hotswap_target = self._browser.hotswap_target
 
+    @property
+    def search_index(self):
+        content = (
+         self._browser.filter_type, self._browser.hotswap_target)
+        if self._search_index is not None:
+            if self._search_index_content[0] != content[0] or liveobj_changed(self._search_index_content[1], content[1]):
+                self.disconnect_disconnectable(self._search_index)
+                self._search_index = None
+        if self._search_index is None:
+            self._search_index_content = content
+            self._search_index = self.register_disconnectable(BrowserSearchIndex(root_items=(self._make_root_browser_items()),
+              tasks=(self._tasks)))
+        return self._search_index
+
+    def show_search_results(self, query):
+        results = self.search_index.search(query)
+        if not results:
+            return False
+        self._invalidate_content_cache()
+        self._on_focused_selection_changed.subject = None
+        self._crop_browser_lists(0)
+        self._append_browser_list(children_iterator=results)
+        self._focused_list_index = 0
+        self.focused_list.selected_index = 0
+        self._on_focused_selection_changed.subject = self.focused_list
+        self._on_focused_selection_changed()
+        return True
+
     def _update_root_items(self):
         if not self._content_cache_is_valid():
             self._update_content_cache()
@@ -8,23 +8,32 @@ from __future__ import absolute_import, print_function, unicode_literals
 from builtins import map
 from itertools import islice
 import Live
-from ableton.v2.base import EventObject, clamp, listenable_property, nop
+from ableton.v2.base import EventObject, clamp, listenable_property, nop, task
 from model.uniqueid import UniqueIdMixin
 
 class BrowserList(EventObject, UniqueIdMixin):
     LAZY_ACCESS_COUNT = 1000
     LAZY_ACCESS_THRESHOLD = LAZY_ACCESS_COUNT - 100
+    MATERIALIZE_CHUNK_SIZE = 200
 
-    def __init__(self, item_iterator=None, item_wrapper=nop, limit=-1, *a, **k):
+    def __init__(self, item_iterator=None, item_wrapper=nop, limit=-1, tasks=None, *a, **k):
         (super(BrowserList, self).__init__)(*a, **k)
         self._selected_index = -1
         self._item_iterator = item_iterator
         self._item_wrapper = item_wrapper
         self._limit = limit
         self._access_all = False
+        self._tasks = tasks
+        self._materialize_task = None
+        self._window_end = None
+        self._is_complete = False
         self._items = []
         self._update_items()
 
+    def disconnect(self):
+        self.stop_materializing()
+        super(BrowserList, self).disconnect()
+
     def _get_limit(self):
         return self._limit
 
@@ -32,6 +41,7 @@ class BrowserList(EventObject, UniqueIdMixin):
         if value != self._limit:
             self._limit = value
             self._access_all = False
+            self.stop_materializing()
             self._update_items()
             self.notify_items()
             if value != -1:
@@ -43,35 +53,95 @@ class BrowserList(EventObject, UniqueIdMixin):
         return self._access_all
 
     def _set_access_all(self, access_all):
-        if self._access_all != access_all:
+        if self._access_all != access_all or self.is_windowed:
             self._access_all = access_all
             self._limit = -1
+            self.stop_materializing()
             self._update_items()
             self.notify_items()
 
     access_all = property(_get_access_all, _set_access_all)
 
+    @property
+    def is_windowed(self):
+        return self._window_end is not None
+
+    @listenable_property
+    def item_count(self):
+        return len(self._items)
+
+    @listenable_property
+    def is_complete(self):
+        return self._is_complete
+
     @listenable_property
     def items(self):
         if self.limit > 0:
-            return self._items[None[:self.limit]]
-        else:
-            return self._access_all or self._items[None[:self.LAZY_ACCESS_COUNT]]
+            return self._items[:self.limit]
+        if not self._access_all:
+            return self._items[:self.LAZY_ACCESS_COUNT]
+        if self.is_windowed:
+            return self._items[:self._window_end]
         return self._items
 
     def _update_items(self):
         if isinstance(self._item_iterator, Live.Browser.BrowserItemIterator):
             if self.limit > 0 and len(self._items) < self.limit:
-                next_slice = islice(self._item_iterator, self.limit)
+                self._materialize(self.limit)
+            elif not self._access_all and len(self._items) < self.LAZY_ACCESS_COUNT:
+                self._materialize(self.LAZY_ACCESS_COUNT - len(self._items))
             else:
-                if (self._access_all or len(self._items)) < self.LAZY_ACCESS_COUNT:
-                    next_slice = islice(self._item_iterator, self.LAZY_ACCESS_COUNT - len(self._items))
-                else:
-                    next_slice = self._item_iterator
-            self._items.extend(list(map(self._item_wrapper, next_slice)))
-        else:
-            if len(self._items) < len(self._item_iterator):
-                self._items = list(map(self._item_wrapper, self._item_iterator))
+                self._materialize()
+        elif len(self._items) < len(self._item_iterator):
+            self._items = list(map(self._item_wrapper, self._item_iterator))
+            self._set_complete()
+
+    def _materialize(self, count=None):
+        if not self._is_complete:
+            next_slice = list(islice(self._item_iterator, count))
+            self._items.extend(map(self._item_wrapper, next_slice))
+            self.notify_item_count()
+            if count is None or len(next_slice) < count:
+                self._set_complete()
+
+    def _set_complete(self):
+        if not self._is_complete:
+            self._is_complete = True
+            self.notify_is_complete()
+
+    def _access_windowed(self):
+        self._access_all = True
+        self._window_end = 0
+        self._materialize_task = self._tasks.add(self._materialize_chunk)
+        self._extend_window()
+
+    def _extend_window(self):
+        window_end = self._selected_index + self.LAZY_ACCESS_COUNT
+        if window_end > len(self._items):
+            self._materialize(window_end - len(self._items))
+        self._window_end = min(window_end, len(self._items))
+        self.notify_items()
+        if self._is_complete and self._window_end == len(self._items):
+            self._finish_windowed_access()
+
+    def _materialize_chunk(self, _delta):
+        self._materialize(self.MATERIALIZE_CHUNK_SIZE)
+        if self._is_complete:
+            self._materialize_task = None
+            self._finish_windowed_access()
+            return task.KILLED
+        return task.RUNNING
+
+    def _finish_windowed_access(self):
+        if self.is_windowed:
+            self.stop_materializing()
+            self.notify_items()
+
+    def stop_materializing(self):
+        if self._materialize_task is not None:
+            self._materialize_task.kill()
+            self._materialize_task = None
+        self._window_end = None
 
     @property
     def selected_item(self):
@@ -79,6 +149,11 @@ class BrowserList(EventObject, UniqueIdMixin):
             return
         return self.items[self.selected_index]
 
+    def _selectable_count(self):
+        if self.is_windowed:
+            return self._window_end
+        return len(self._items)
+
     @listenable_property
     def selected_index(self):
         return self._selected_index
@@ -86,14 +161,20 @@ class BrowserList(EventObject, UniqueIdMixin):
     @selected_index.setter
     def selected_index(self, value):
         if value != self._selected_index:
-            num_children = len(self._items)
+            num_children = self._selectable_count()
             if value < -1 or value >= num_children:
                 raise IndexError("Index %i must be in [-1..%i]" % (value, num_children - 1))
             self._selected_index = value
             self.notify_selected_index()
             if self._selected_index >= self.LAZY_ACCESS_THRESHOLD:
                 if not self._access_all:
-                    self.access_all = True
+                    if self._tasks is not None:
+                        self._access_windowed()
+                    else:
+                        self.access_all = True
+                elif self.is_windowed:
+                    if self._selected_index >= self._window_end - (self.LAZY_ACCESS_COUNT - self.LAZY_ACCESS_THRESHOLD):
+                        self._extend_window()
 
     def select_index_with_offset(self, offset):
-        self.selected_index = clamp(self._selected_index + offset, 0, len(self._items) - 1)
+        self.selected_index = clamp(self._selected_index + offset, 0, self._selectable_count() - 1)
@@ -0,0 +1,130 @@
+from __future__ import absolute_import, print_function, unicode_literals
+import re
+from ableton.v2.base import EventObject, listenable_property, task
+WORD_START_RE = re.compile("(?:^|(?<=[\\s\\-_/.(]))\\w", re.UNICODE)
+PATH_SEPARATOR = "/"
+
+def word_starts(name):
+    return [match.start() for match in WORD_START_RE.finditer(name)]
+
+
+def can_have_indexed_children(item):
+    return not item.is_loadable or item.is_device
+
+
+class BrowserSearchIndex(EventObject):
+    INDEX_CHUNK_SIZE = 500
+    PREFIX_KEY_LENGTH = 2
+    DEFAULT_RESULT_LIMIT = 200
+
+    def __init__(self, root_items=(), tasks=None, *a, **k):
+        (super(BrowserSearchIndex, self).__init__)(*a, **k)
+        self._pending = [((), iter(root_items))]
+        self._items = []
+        self._names = []
+        self._paths = []
+        self._prefix_buckets = {}
+        self._is_complete = False
+        self._index_task = None
+        if tasks is not None:
+            self._index_task = tasks.add(self._index_chunk)
+
+    def disconnect(self):
+        if self._index_task is not None:
+            self._index_task.kill()
+            self._index_task = None
+        self._pending = []
+        super(BrowserSearchIndex, self).disconnect()
+
+    @listenable_property
+    def indexed_count(self):
+        return len(self._items)
+
+    @listenable_property
+    def is_complete(self):
+        return self._is_complete
+
+    def index_items(self, count=None):
+        pending = self._pending
+        indexed = 0
+        while pending and (count is None or indexed < count):
+            path, iterator = pending[-1]
+            item = next(iterator, None)
+            if item is None:
+                pending.pop()
+                continue
+            self._add_item(item, path)
+            indexed += 1
+            if can_have_indexed_children(item):
+                pending.append((path + (item.name,), iter(item.iter_children)))
+
+        if indexed:
+            self.notify_indexed_count()
+        if not pending:
+            if not self._is_complete:
+                self._is_complete = True
+                self.notify_is_complete()
+
+    def _index_chunk(self, _delta):
+        self.index_items(self.INDEX_CHUNK_SIZE)
+        if self._is_complete:
+            self._index_task = None
+            return task.KILLED
+        return task.RUNNING
+
+    def _add_item(self, item, path):
+        index = len(self._items)
+        name = item.name.lower()
+        self._items.append(item)
+        self._names.append(name)
+        self._paths.append(PATH_SEPARATOR.join(path).lower())
+        key_length = self.PREFIX_KEY_LENGTH
+        for start in word_starts(name):
+            key = name[start:start + key_length]
+            self._prefix_buckets.setdefault(key, []).append((index, start))
+
+    def search(self, query, limit=DEFAULT_RESULT_LIMIT):
+        query = query.strip().lower()
+        if not query:
+            return []
+        if PATH_SEPARATOR in query:
+            return self._path_matches(query, limit)
+        matches = self._prefix_matches(query, limit)
+        if len(matches) < limit:
+            matched = set(matches)
+            for index, name in enumerate(self._names):
+                if query in name:
+                    if index not in matched:
+                        matches.append(index)
+                        if len(matches) >= limit:
+                            break
+
+        return [self._items[index] for index in matches]
+
+    def _path_matches(self, query, limit):
+        query = PATH_SEPARATOR.join((part.strip() for part in query.split(PATH_SEPARATOR)))
+        matches = []
+        for item, name, path in zip(self._items, self._names, self._paths):
+            if query in path + PATH_SEPARATOR + name:
+                matches.append(item)
+                if len(matches) >= limit:
+                    break
+
+        return matches
+
+    def _prefix_matches(self, query, limit):
+        names = self._names
+        if len(query) >= self.PREFIX_KEY_LENGTH:
+            candidates = self._prefix_buckets.get(query[:self.PREFIX_KEY_LENGTH], ())
+        else:
+            candidates = (entry for key, bucket in self._prefix_buckets.items() if key.startswith(query) for entry in bucket)
+        name_matches = []
+        word_matches = []
+        seen = set()
+        for index, start in candidates:
+            if index not in seen:
+                if names[index].startswith(query, start):
+                    seen.add(index)
+                    (name_matches if start == 0 else word_matches).append(index)
+
+        return sorted(name_matches)[:limit] + sorted(word_matches)[:max(0, limit - len(name_matches))]
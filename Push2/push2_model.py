@@ -7,12 +7,47 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import object
 import json, logging
+from collections import OrderedDict
 from pprint import pformat
+from time import time
+from future.utils import iteritems
 from ableton.v2.base import PY2
 from .model import RootModel
 from model.generation import ModelUpdateNotifier, generate_mrs_model
 logger = logging.getLogger(__name__)
 
+def copy_json(data):
+    if isinstance(data, dict):
+        return dict(((key, copy_json(value)) for key, value in iteritems(data)))
+    if isinstance(data, list):
+        return [copy_json(value) for value in data]
+    return data
+
+
+def diff_json(old, new, path, changes):
+    if isinstance(new, dict):
+        if not isinstance(old, dict) or len(old) != len(new):
+            return False
+        for key, value in iteritems(new):
+            if key not in old or not diff_json(old[key], value, path + [key], changes):
+                return False
+
+        return True
+    if isinstance(new, list):
+        if not isinstance(old, list) or len(old) != len(new):
+            return False
+        for index, value in enumerate(new):
+            if not diff_json(old[index], value, path + [index], changes):
+                return False
+
+        return True
+    if isinstance(old, (dict, list)):
+        return False
+    if old != new or type(old) != type(new):
+        changes.append((path, new))
+    return True
+
+
 class Sender(object):
 
     def __init__(self, message_sink=None, process_connected=None, *a, **k):
@@ -21,41 +56,93 @@ class Sender(object):
         if process_connected is None:
             process_connected = lambda: True
         self._process_connected = process_connected
-        self._attribute_paths = []
+        self._attribute_paths = OrderedDict()
         self._structural_change = False
+        self._snapshot = {}
         self.notifier = ModelUpdateNotifier(delegate=self)
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        self.sent_messages = 0
+        self.sent_bytes = 0
+        self.serialization_time = 0.0
+        self.coalesced_updates = 0
 
     def structural_change(self, path):
-        self._attribute_paths.append((path, None))
+        self._add_attribute_path(path, None)
         self._structural_change = True
 
     def attribute_changed(self, path, value):
-        self._attribute_paths.append((path, value))
+        self._add_attribute_path(path, value)
+
+    def _add_attribute_path(self, path, value):
+        key = tuple(path)
+        if key in self._attribute_paths:
+            del self._attribute_paths[key]
+            self.coalesced_updates += 1
+        self._attribute_paths[key] = (path, value)
 
     def send(self, root_model, send_all=False):
+        start_time = time()
+        sent_bytes = [0]
 
         def send_data(data):
             if data["command"] == "full-model-update":
                 data["fingerprint"] = root_model.__fingerprint__
             raw = json.dumps(data, ensure_ascii=True)
             self._message_sink(raw)
+            self.sent_messages += 1
+            sent_bytes[0] += len(raw)
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Model sent: %s", pformat(data))
 
+        attribute_paths = list(self._attribute_paths.values())
         if send_all:
-            send_data(dict(command="full-model-update", payload=(root_model.to_json())))
+            payload = root_model.to_json()
+            self._snapshot = copy_json(payload)
+            send_data(dict(command="full-model-update", payload=payload))
         else:
             if self._structural_change:
-                root_keys = set((path[0][0] for path in self._attribute_paths))
-                data = dict(command="full-model-update",
-                  payload=(root_model.to_json(root_keys)))
-                send_data(data)
+                root_keys = set((path[0][0] for path in attribute_paths))
+                full_update, path_updates = self._diff_against_snapshot(root_model.to_json(root_keys))
+                if full_update:
+                    send_data(dict(command="full-model-update", payload=full_update))
+                if path_updates:
+                    send_data(dict(command="path-model-update", payload=path_updates))
             else:
-                if self._attribute_paths:
-                    data = dict(command="path-model-update", payload=(self._attribute_paths))
+                if attribute_paths:
+                    self._apply_to_snapshot(attribute_paths)
+                    data = dict(command="path-model-update", payload=attribute_paths)
                     send_data(data)
-        self._attribute_paths = []
+        self._attribute_paths = OrderedDict()
         self._structural_change = False
+        self.sent_bytes += sent_bytes[0]
+        self.serialization_time += time() - start_time
+
+    def _diff_against_snapshot(self, root_data):
+        full_update = {}
+        path_updates = []
+        for key, value in iteritems(root_data):
+            changes = []
+            if key in self._snapshot and diff_json(self._snapshot[key], value, [key], changes):
+                path_updates.extend(changes)
+            else:
+                full_update[key] = value
+            self._snapshot[key] = copy_json(value)
+
+        return (
+         full_update, path_updates)
+
+    def _apply_to_snapshot(self, attribute_paths):
+        for path, value in attribute_paths:
+            try:
+                data = self._snapshot
+                for step in path[:-1]:
+                    data = data[step]
+
+                data[path[-1]] = copy_json(value)
+            except (KeyError, IndexError, TypeError):
+                self._snapshot.pop(path[0], None)
 
 
 class Root(generate_mrs_model(RootModel)):
@@ -8,11 +8,13 @@ from __future__ import absolute_import, print_function, unicode_literals
 from builtins import filter, map, range, str
 from future.utils import string_types
 import logging, traceback
+from collections import OrderedDict
 from contextlib import contextmanager
 from functools import partial, wraps
 from itertools import chain
 import Live
-from ableton.v2.base import old_hasattr
+from ableton.v2.base import PrefixTree, old_hasattr
+from ableton.v2.control_surface.midi_output_scheduler import MidiOutputScheduler
 from . import Defaults, Task
 from .ControlElement import OptimizedOwnershipHandler
 from .Dependency import inject
@@ -55,6 +57,7 @@ def get_control_surfaces():
 
 class ControlSurface(Subject, SlotManager):
     received_midi = ()
+    midi_bytes_per_tick = None
     __subject_events__ = ('received_midi', 'disconnect')
 
     def __init__(self, c_instance=None, *a, **k):
@@ -72,6 +75,7 @@ class ControlSurface(Subject, SlotManager):
         self._highlighting_session_component = None
         self._device_component = None
         self._forwarding_long_identifier_registry = {}
+        self._forwarding_long_identifier_tree = PrefixTree()
         self._forwarding_registry = {}
         self._is_sending_scheduled_messages = BooleanContext()
         self._remaining_scheduled_messages = []
@@ -85,7 +89,10 @@ class ControlSurface(Subject, SlotManager):
         self._midi_message_dict = {}
         self._midi_message_list = []
         self._midi_message_count = 0
+        self._midi_barrier_counts = set()
         self.mxd_midi_scheduler = MessageScheduler(self._do_send_midi, self._task_group.add(Task.TimedCallbackTask()))
+        self.midi_output_scheduler = MidiOutputScheduler(send_midi=(self._do_send_midi),
+          bytes_per_tick=(self.midi_bytes_per_tick))
         self._control_surface_injector = inject(parent_task_group=(const(self._task_group)),
           show_message=(const(self.show_message)),
           log_message=(const(self.log_message)),
@@ -132,6 +139,7 @@ class ControlSurface(Subject, SlotManager):
         self._displays = None
         self._device_component = None
         self._pad_translations = None
+        self.midi_output_scheduler.clear()
         cs_list = self._control_surfaces()
         if self in cs_list:
             cs_list.remove(self)
@@ -227,6 +235,7 @@ class ControlSurface(Subject, SlotManager):
                 if isinstance(control, InputControlElement):
                     control.install_connections(self._translate_message, partial(self._install_mapping, midi_map_handle), partial(self._install_forwarding, midi_map_handle))
 
+            self._forwarding_long_identifier_tree = PrefixTree(iter(self._forwarding_long_identifier_registry.items()))
             if self._pad_translations != None:
                 self._c_instance.set_pad_translation(self._pad_translations)
 
@@ -249,6 +258,7 @@ class ControlSurface(Subject, SlotManager):
 
     @profile
     def update_display(self):
+        self.midi_output_scheduler.start_tick()
         with self.component_guard():
             with self._is_sending_scheduled_messages():
                 self._task_group.update(Defaults.TIMER_DELAY)
@@ -258,6 +268,11 @@ class ControlSurface(Subject, SlotManager):
         with self.component_guard():
             self._do_receive_midi(midi_bytes)
 
+    @profile
+    def receive_midi_chunk(self, midi_chunk):
+        with self.component_guard():
+            self._do_receive_midi_chunk(midi_chunk)
+
     def is_sysex_message(self, midi_bytes):
         return len(midi_bytes) != 3
 
@@ -269,15 +284,43 @@ class ControlSurface(Subject, SlotManager):
         else:
             self.handle_sysex(midi_bytes)
 
+    def _do_receive_midi_chunk(self, midi_chunk):
+        midi_data_for_recipient = OrderedDict()
+        for midi_bytes in midi_chunk:
+            (self.notify_received_midi)(*midi_bytes)
+            self.mxd_midi_scheduler.handle_message(midi_bytes)
+            recipient = None
+            if not self.is_sysex_message(midi_bytes):
+                recipient = self.get_recipient_for_nonsysex_midi_message(midi_bytes)
+            if recipient is not None and recipient.allow_receiving_chunks:
+                _, values = midi_data_for_recipient.setdefault(recipient, (recipient, []))
+                values.append(self._extract_nonsysex_value(midi_bytes))
+            else:
+                midi_data_for_recipient[object()] = (
+                 None, midi_bytes)
+
+        for recipient, data in iter(midi_data_for_recipient.values()):
+            if recipient is not None:
+                recipient.receive_chunk(tuple(data))
+            elif not self.is_sysex_message(data):
+                self.handle_nonsysex(data)
+            else:
+                self.handle_sysex(data)
+
+    @staticmethod
+    def _extract_nonsysex_value(midi_bytes):
+        if midi_bytes[0] & 240 == MIDI_PB_STATUS:
+            return midi_bytes[1] + (midi_bytes[2] << 7)
+        return midi_bytes[2]
+
     def get_recipient_for_nonsysex_midi_message(self, midi_bytes):
         is_pitchbend = midi_bytes[0] & 240 == MIDI_PB_STATUS
-        forwarding_key = midi_bytes[None[:1 if is_pitchbend else 2]]
+        forwarding_key = midi_bytes[:1 if is_pitchbend else 2]
         if forwarding_key in self._forwarding_registry:
             return self._forwarding_registry[forwarding_key]
 
     def handle_nonsysex(self, midi_bytes):
-        is_pitchbend = midi_bytes[0] & 240 == MIDI_PB_STATUS
-        value = midi_bytes[1] + (midi_bytes[2] << 7) if is_pitchbend else midi_bytes[2]
+        value = self._extract_nonsysex_value(midi_bytes)
         recipient = self.get_recipient_for_nonsysex_midi_message(midi_bytes)
         if recipient is not None:
             recipient.receive_value(value)
@@ -286,10 +329,10 @@ class ControlSurface(Subject, SlotManager):
                 self.log_message("Got unknown message: " + str(midi_bytes))
 
     def handle_sysex(self, midi_bytes):
-        result = find_if((lambda id__: midi_bytes[None[:len(id__[0])]] == id__[0]), iter(self._forwarding_long_identifier_registry.items()))
+        result = self._forwarding_long_identifier_tree.longest_prefix_item(midi_bytes)
         if result != None:
             id, control = result
-            control.receive_value(midi_bytes[len(id)[:-1]])
+            control.receive_value(midi_bytes[len(id):-1])
         else:
             if self.received_midi_listener_count() == 0:
                 self.log_message("Got unknown sysex message: " + str(midi_bytes))
@@ -431,27 +474,42 @@ class ControlSurface(Subject, SlotManager):
     def get_control_by_name(self, control_name):
         return find_if((lambda c: c.name == control_name), self.controls)
 
-    def _send_midi(self, midi_event_bytes, optimized=True):
+    def _send_midi(self, midi_event_bytes, optimized=True, barrier=False):
         if self._accumulate_midi_messages:
             sysex_status_byte = 240
             entry = (self._midi_message_count, midi_event_bytes)
-            if optimized and midi_event_bytes[0] != sysex_status_byte:
+            if optimized and not barrier and midi_event_bytes[0] != sysex_status_byte:
                 self._midi_message_dict[(midi_event_bytes[0], midi_event_bytes[1])] = entry
             else:
                 self._midi_message_list.append(entry)
+                if barrier:
+                    self._midi_barrier_counts.add(self._midi_message_count)
             self._midi_message_count += 1
+        elif self.midi_output_scheduler.is_budgeted:
+            self.midi_output_scheduler.enqueue(midi_event_bytes, optimized=optimized, barrier=barrier)
+            self.midi_output_scheduler.send_pending()
         else:
             self._do_send_midi(midi_event_bytes)
         return True
 
     def _flush_midi_messages(self):
-        for _, message in sorted((chain(self._midi_message_list, iter(self._midi_message_dict.values()))),
-          key=first):
-            self._do_send_midi(message)
+        scheduler = self.midi_output_scheduler
+        if scheduler.is_budgeted:
+            listed_messages = ((count, message, False) for count, message in self._midi_message_list)
+            coalesced_messages = ((count, message, True) for count, message in iter(self._midi_message_dict.values()))
+            for count, message, optimized in sorted((chain(listed_messages, coalesced_messages)), key=first):
+                scheduler.enqueue(message, optimized=optimized, barrier=(count in self._midi_barrier_counts))
+
+            scheduler.send_pending()
+        else:
+            for _, message in sorted((chain(self._midi_message_list, iter(self._midi_message_dict.values()))),
+              key=first):
+                self._do_send_midi(message)
 
         self._midi_message_dict.clear()
         self._midi_message_list[None[:None]] = []
         self._midi_message_count = 0
+        self._midi_barrier_counts.clear()
 
     def _do_send_midi(self, midi_event_bytes):
         try:
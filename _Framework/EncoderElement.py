@@ -18,6 +18,8 @@ def _not_implemented(value):
 
 
 _map_modes = map_modes = Live.MidiMap.MapMode
+ABSOLUTE_MAP_MODES = (
+ _map_modes.absolute, _map_modes.absolute_14_bit)
 ENCODER_VALUE_NORMALIZER = {(_map_modes.relative_smooth_two_compliment): (lambda v:                                               if v <= 64:
 v # Avoid dead code: v - 128), 
  
@@ -35,11 +37,15 @@ class EncoderElement(InputControlElement):
     __subject_events__ = (
      SubjectEvent(name="normalized_value", signal=InputSignal),)
     encoder_sensitivity = 1.0
+    allow_receiving_chunks = True
+    coalesce_received_values = False
 
-    def __init__(self, msg_type, channel, identifier, map_mode, encoder_sensitivity=None, *a, **k):
+    def __init__(self, msg_type, channel, identifier, map_mode, encoder_sensitivity=None, *a, coalesce_received_values=None, **k):
         (super(EncoderElement, self).__init__)(msg_type, channel, identifier, *a, **k)
         if encoder_sensitivity is not None:
             self.encoder_sensitivity = encoder_sensitivity
+        if coalesce_received_values is not None:
+            self.coalesce_received_values = coalesce_received_values
         if map_mode is _map_modes.absolute_14_bit and identifier > MAX_14_BIT_CC:
             self._EncoderElement__map_mode = _map_modes.absolute
         else:
@@ -60,6 +66,12 @@ class EncoderElement(InputControlElement):
         if self.normalized_value_listener_count():
             self.notify_normalized_value(self.normalize_value(value))
 
+    def receive_chunk(self, chunk):
+        if self.coalesce_received_values and self.message_map_mode() in ABSOLUTE_MAP_MODES:
+            self.receive_value(chunk[-1])
+        else:
+            super(EncoderElement, self).receive_chunk(chunk)
+
 
 class TouchEncoderElementBase(EncoderElement):
 
@@ -127,6 +127,7 @@ class InputControlElement(NotifyingControlElement):
     _input_signal_listener_count = 0
     num_delayed_messages = 1
     send_depends_on_forwarding = True
+    allow_receiving_chunks = False
 
     @depends(request_rebuild_midi_map=(const(nop)))
     def __init__(self, msg_type=None, channel=None, identifier=None, sysex_identifier=None, request_rebuild_midi_map=None, *a, **k):
@@ -370,6 +371,10 @@ class InputControlElement(NotifyingControlElement):
             is_input = True
             self._report_value(value, is_input)
 
+    def receive_chunk(self, chunk):
+        for value in chunk:
+            self.receive_value(value)
+
     def set_report_values(self, report_input, report_output):
         self._report_input = report_input
         self._report_output = report_output
@@ -6,7 +6,22 @@
 # Size of source mod 2**32: 9234 bytes
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import object
-from collections import namedtuple
+from collections import deque
+from time import time
+
+class Request(object):
+    __slots__ = ('action', 'owner', 'message', 'timeout', 'queued_at')
+
+    def __init__(self, action, owner, message, timeout):
+        self.action = action
+        self.owner = owner
+        self.message = message
+        self.timeout = timeout
+        self.queued_at = time()
+
+    def __repr__(self):
+        return "Request(action={}, owner={})".format(self.action, self.owner)
+
 
 class MessageScheduler(object):
 
@@ -15,25 +30,41 @@ class MessageScheduler(object):
         self._timer = timer
         self._state = "idle"
         self._owner = None
-        self._request_type = namedtuple("Request", "action owner message timeout")
-        self._request_queue = []
+        self._request_queues = {}
+        self._ready_owners = deque()
+        self._queue_depth = 0
+        self.max_queue_depth = 0
+        self.processed_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
 
     @property
     def is_idling(self):
-        return self._state == "idle" and self._owner == None and len(self._request_queue) == 0
+        return self._state == "idle" and self._owner == None and self._queue_depth == 0
+
+    @property
+    def queue_depth(self):
+        return self._queue_depth
+
+    @property
+    def average_wait_time(self):
+        if self.processed_count:
+            return self.total_wait_time / self.processed_count
+        return 0.0
 
     def __repr__(self):
         return "MessageScheduler(state={}, owner={})".format(self._state, self._owner)
 
     def _process_request(self, request):
-        if request.action == "send" and not self._state == "idle":
+        if request.action == "send":
+            if self._state == "idle":
+                self._send_message_callback(request.message)
+                return True
             if self._state == "grabbed":
                 if self._owner == request.owner:
                     self._send_message_callback(request.message)
                     return True
             return False
-        else:
-            pass
         if request.action == "grab":
             if self._state == "idle":
                 self._state = "grabbed"
@@ -72,40 +103,85 @@ class MessageScheduler(object):
                     return False
 
     def _queue(self, request):
-        if request.owner is not None:
-            self._request_queue.append(request)
+        owner = request.owner
+        if owner is not None:
+            queue = self._request_queues.get(owner)
+            if queue is None:
+                queue = self._request_queues[owner] = deque()
+                self._ready_owners.append((owner, queue))
+            queue.append(request)
+            self._queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._queue_depth)
+
+    def _next_owner(self):
+        if self._owner is not None:
+            if self._owner in self._request_queues:
+                return self._owner
+            return
+        head = self._ready_head()
+        if head is not None:
+            return head[0]
+
+    def _ready_head(self):
+        ready_owners = self._ready_owners
+        while ready_owners:
+            owner, queue = ready_owners[0]
+            if self._request_queues.get(owner) is queue:
+                return ready_owners[0]
+            ready_owners.popleft()
+
+    def _retire_owner(self, owner):
+        del self._request_queues[owner]
+        if len(self._ready_owners) > 2 * len(self._request_queues) + 8:
+            self._ready_owners = deque((entry for entry in self._ready_owners if self._request_queues.get(entry[0]) is entry[1]))
 
     def _process_single_request(self):
-        for i, request in enumerate(self._request_queue):
-            if self._owner in (None, request.owner):
-                if self._process_request(request):
-                    del self._request_queue[i]
-                    return True
-                return False
+        owner = self._next_owner()
+        if owner is None:
+            return False
+        queue = self._request_queues[owner]
+        request = queue[0]
+        if not self._process_request(request):
+            return False
+        queue.popleft()
+        self._queue_depth -= 1
+        self._record_wait_time(request)
+        if queue:
+            head = self._ready_head()
+            if head is not None:
+                if head[0] == owner:
+                    self._ready_owners.rotate(-1)
+        else:
+            self._retire_owner(owner)
+        return True
 
-        return False
+    def _record_wait_time(self, request):
+        wait_time = time() - request.queued_at
+        self.processed_count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
 
     def _process_queue(self):
         while self._process_single_request():
             pass
 
     def send(self, owner, message):
-        request = self._request_type("send", owner, message, 0)
+        request = Request("send", owner, message, 0)
         self._queue(request)
         self._process_queue()
 
     def grab(self, owner):
-        request = self._request_type("grab", owner, None, 0)
+        request = Request("grab", owner, None, 0)
         self._queue(request)
         self._process_queue()
 
     def release(self, owner):
-        request = self._request_type("release", owner, None, 0)
+        request = Request("release", owner, None, 0)
         self._queue(request)
         self._process_queue()
 
     def send_receive(self, owner, message, timeout):
-        request = self._request_type("send_receive", owner, message, timeout)
+        request = Request("send_receive", owner, message, timeout)
         self._queue(request)
         self._process_queue()
 
@@ -145,7 +221,10 @@ class MessageScheduler(object):
 
     def disconnect(self, owner):
         if self._state != "idle":
-            self._request_queue = [r for r in self._request_queue if r.owner != owner]
+            queue = self._request_queues.get(owner)
+            if queue is not None:
+                self._queue_depth -= len(queue)
+                self._retire_owner(owner)
             if self._owner == owner:
                 self._owner = None
                 self._state = "idle"
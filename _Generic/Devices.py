@@ -9,6 +9,7 @@ from builtins import filter, map, range, str
 from past.utils import old_div
 from functools import partial
 from _Framework.Util import group
+from ableton.v2.base import liveobj_valid
 RCK_BANK1 = ('Macro 1', 'Macro 2', 'Macro 3', 'Macro 4', 'Macro 5', 'Macro 6', 'Macro 7',
              'Macro 8')
 RCK_BANK2 = ('Macro 9', 'Macro 10', 'Macro 11', 'Macro 12', 'Macro 13', 'Macro 14',
@@ -759,12 +760,13 @@ def parameter_bank_names(device, bank_name_dict=BANK_NAME_DICT):
     return []
 
 
-def parameter_banks(device, device_dict=DEVICE_DICT):
+def _parameter_banks(device, device_dict):
     if device != None:
         if device.class_name in list(device_dict.keys()):
+            parameters = _parameters_by_original_name(device)
 
             def names_to_params(bank):
-                return list(map(partial(get_parameter_by_name, device), bank))
+                return list(map(parameters.get, bank))
 
             return list(map(names_to_params, device_dict[device.class_name]))
         if device.class_name in MAX_DEVICES:
@@ -790,11 +792,11 @@ def parameter_banks(device, device_dict=DEVICE_DICT):
     return []
 
 
-def best_of_parameter_bank(device, device_bob_dict=DEVICE_BOB_DICT):
+def _best_of_parameter_bank(device, device_bob_dict):
     if device:
         if device.class_name in device_bob_dict:
             bobs = device_bob_dict[device.class_name]
-            return list(map(partial(get_parameter_by_name, device), bobs[0]))
+            return list(map(_parameters_by_original_name(device).get, bobs[0]))
     if device.class_name in MAX_DEVICES:
         try:
             parameter_indices = device.get_bank_parameters(-1)
@@ -823,6 +825,71 @@ def number_of_parameter_banks(device, device_dict=DEVICE_DICT):
     return 0
 
 
+class _DeviceBankTable(object):
+
+    def __init__(self, device):
+        self.device = device
+        self.parameters = tuple(device.parameters)
+        self._results = {}
+
+    def is_valid_for(self, device):
+        return tuple(device.parameters) == self.parameters
+
+    def result(self, key, compute):
+        if key not in self._results:
+            self._results[key] = compute()
+        return self._results[key]
+
+
+_MAX_BANK_TABLES = 16
+_bank_tables = []
+
+def _bank_table(device):
+    for table in _bank_tables:
+        if table.device == device:
+            if table.is_valid_for(device):
+                return table
+            break
+
+    table = _DeviceBankTable(device)
+    _bank_tables[:] = [table] + [t for t in _bank_tables if liveobj_valid(t.device) if t.device != device][:_MAX_BANK_TABLES - 1]
+    return table
+
+
+def _copy_bank(bank):
+    if isinstance(bank, list):
+        return list(bank)
+    return bank
+
+
+def _copy_banks(banks):
+    return _copy_bank(list(map(_copy_bank, banks)))
+
+
+def parameter_banks(device, device_dict=DEVICE_DICT):
+    if device != None:
+        if device_dict is DEVICE_DICT:
+            if device.class_name in device_dict:
+                return _copy_banks(_bank_table(device).result("banks", partial(_parameter_banks, device, device_dict)))
+    return _parameter_banks(device, device_dict)
+
+
+def best_of_parameter_bank(device, device_bob_dict=DEVICE_BOB_DICT):
+    if device:
+        if device_bob_dict is DEVICE_BOB_DICT:
+            if device.class_name in device_bob_dict:
+                return _copy_bank(_bank_table(device).result("best_of", partial(_best_of_parameter_bank, device, device_bob_dict)))
+    return _best_of_parameter_bank(device, device_bob_dict)
+
+
+def _parameters_by_original_name(device):
+    parameters = {}
+    for parameter in device.parameters:
+        parameters.setdefault(parameter.original_name, parameter)
+
+    return parameters
+
+
 def get_parameter_by_name(device, name):
     for i in device.parameters:
         if i.original_name == name:
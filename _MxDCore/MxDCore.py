@@ -12,12 +12,12 @@ import json, logging
 from functools import partial, reduce, wraps
 import Live.Base, _Framework
 import _Framework.Disconnectable as Disconnectable
-from ableton.v2.base import PY2, old_hasattr
+from ableton.v2.base import PY2, liveobj_valid, old_hasattr
 from .LomTypes import CONTROL_SURFACES, ENUM_TYPES, LIVE_APP, PROPERTY_TYPES, ROOT_KEYS, LomAttributeError, LomNoteOperationError, LomNoteOperationWarning, LomObjectError, MFLPropertyFormats, data_dict_to_json, get_exposed_lom_types, get_exposed_property_info, get_root_prop, is_control_surface, is_cplusplus_lom_object, is_lom_object, is_object_iterable, verify_object_property
 from .LomUtils import LomInformation, LomIntrospection, LomPathCalculator, LomPathResolver, is_control_surfaces_list, wrap_control_surfaces_list
 from .MxDControlSurfaceAPI import MxDControlSurfaceAPI
 from .MxDUtils import StringHandler, TupleWrapper
-from .NotesAPIUtils import MIDI_NOTE_ATTRS, VALID_DUPLICATE_NOTES_BY_ID_PARAMETERS, midi_note_to_dict, verify_note_specification_requirements
+from .NotesAPIUtils import COLUMNS_FORMAT, MIDI_NOTE_ATTRS, VALID_DUPLICATE_NOTES_BY_ID_PARAMETERS, midi_note_to_dict, midi_notes_to_columns, note_columns_to_rows, slice_note_columns, verify_note_specification_requirements
 logger = logging.getLogger(__name__)
 
 def get_current_max_device(device_id):
@@ -124,6 +124,8 @@ class MxDCore(object):
         self.lom_classes = get_exposed_lom_types()
         self.lom_classes += LomIntrospection(_Framework).lom_classes
         self.appointed_lom_ids = {0: None}
+        self._resolved_paths = {}
+        self._reset_path_cache_statistics()
 
     def disconnect(self):
         for dev_id in list(self.device_contexts.keys()):
@@ -132,6 +134,7 @@ class MxDCore(object):
                 self.release_device_context(dev_id)
 
         TupleWrapper.forget_tuple_wrapper_instances()
+        self._invalidate_resolved_paths()
         self.manager.set_manager_callbacks(None, None, None, None)
         self.manager = None
         del self.appointed_lom_ids
@@ -296,6 +299,7 @@ class MxDCore(object):
                 if len(object_context[PATH_KEY]) > 0:
                     object_context[PATH_KEY] = []
                     self._install_path_listeners(device_id, key, self._path_listener_callback)
+                self._resolved_paths.pop((device_id, key), None)
 
         del self.device_contexts[device_id]
 
@@ -311,6 +315,7 @@ class MxDCore(object):
         if found_cs_references:
             TupleWrapper.forget_tuple_wrapper_instances()
             self.appointed_lom_ids = {0: None}
+        self._invalidate_resolved_paths()
         self._cs_api.wrapper_registry.clear()
 
     def path_set_path(self, device_id, object_id, parameters):
@@ -664,6 +669,23 @@ class MxDCore(object):
                     return
 
     def _object_from_path(self, device_id, object_id, path_components, must_exist):
+        context_key = (
+         device_id, object_id)
+        path_key = tuple(path_components)
+        cached_path, lom_object = self._resolved_paths.get(context_key, (None, None))
+        if cached_path == path_key and liveobj_valid(lom_object):
+            self.path_cache_hits += 1
+            return lom_object
+        self.path_cache_misses += 1
+        lom_object = self._resolve_path(device_id, object_id, path_components, must_exist)
+        if lom_object is not None:
+            self._resolved_paths[context_key] = (
+             path_key, lom_object)
+        else:
+            self._resolved_paths.pop(context_key, None)
+        return lom_object
+
+    def _resolve_path(self, device_id, object_id, path_components, must_exist):
         lom_object = None
         try:
             resolver = LomPathResolver(path_components,
@@ -682,6 +704,22 @@ class MxDCore(object):
 
         return lom_object
 
+    def _invalidate_resolved_paths(self):
+        if self._resolved_paths:
+            self.path_cache_invalidations += 1
+            self._resolved_paths.clear()
+
+    def _reset_path_cache_statistics(self):
+        self.path_cache_hits = 0
+        self.path_cache_misses = 0
+        self.path_cache_invalidations = 0
+
+    def path_cache_statistics(self):
+        return dict(hits=(self.path_cache_hits),
+          misses=(self.path_cache_misses),
+          invalidations=(self.path_cache_invalidations),
+          size=(len(self._resolved_paths)))
+
     def _get_current_lom_object(self, device_id, object_id):
         return self._get_lom_object_by_lom_id(device_id, self._get_current_lom_id(device_id, object_id))
 
@@ -734,6 +772,7 @@ class MxDCore(object):
                 getattr(lom_object, "remove_%s_listener" % attribute)(listener)
 
     def _path_listener_callback(self, device_id, object_id):
+        self._invalidate_resolved_paths()
         device_context = self.device_contexts[device_id]
         object_context = device_context[object_id]
         resulting_id = self._get_lom_id_by_lom_object(self._object_from_path(device_id,
@@ -800,10 +839,14 @@ class MxDCore(object):
     def _do_get_notes_extended(self, device_id, object_id, lom_object, function_name, param_dict, *function_parameters):
         verify_object_property(lom_object, function_name, self.epii_version)
         properties_to_return = None
+        output_format = None
+        chunk_size = None
         if param_dict is not None:
             properties_to_return = param_dict.pop("return", None)
             if properties_to_return is not None:
                 properties_to_return = self._sanitize_midi_note_property_list(device_id, object_id, properties_to_return)
+            output_format = param_dict.pop("format", None)
+            chunk_size = param_dict.pop("chunk_size", None)
         try:
             func = getattr(lom_object, function_name)
             midi_note_vector = func(**param_dict) if param_dict is not None else func(*function_parameters)
@@ -814,13 +857,32 @@ class MxDCore(object):
                 e = None
                 del e
 
-        result = self.str_representation_for_object(self._midi_note_vector_to_dict_output(midi_note_vector, properties_to_return))
-        self.manager.send_message(device_id, object_id, "obj_call_result", result)
+        if output_format == COLUMNS_FORMAT:
+            self._send_note_columns(device_id, object_id, midi_note_vector, properties_to_return, chunk_size)
+        else:
+            result = self.str_representation_for_object(self._midi_note_vector_to_dict_output(midi_note_vector, properties_to_return))
+            self.manager.send_message(device_id, object_id, "obj_call_result", result)
+
+    def _send_note_columns(self, device_id, object_id, notes, properties_to_return, chunk_size):
+        columns = midi_notes_to_columns(notes, properties_to_return)
+        note_count = len(notes)
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            chunk_size = max(note_count, 1)
+        for offset in range(0, max(note_count, 1), chunk_size):
+            result = json.dumps({'notes':slice_note_columns(columns, offset, offset + chunk_size), 
+             'offset':offset, 
+             'total':note_count},
+              ensure_ascii=True)
+            self.manager.send_message(device_id, object_id, "obj_call_result", self.str_representation_for_object(result))
 
     def _object_add_new_notes_handler(self, device_id, object_id, lom_object, parameters):
         function_name, function_parameter = parameters[0], parameters[1]
         verify_object_property(lom_object, function_name, self.epii_version)
         note_dicts = self._get_list_of_note_dictionaries(function_parameter)
+        if isinstance(note_dicts, dict):
+            names, rows = note_columns_to_rows(note_dicts)
+            verify_note_specification_requirements(dict.fromkeys(names))
+            note_dicts = [dict(zip(names, row)) for row in rows]
         note_specifications = []
         for note_dict in note_dicts:
             verify_note_specification_requirements(note_dict)
@@ -856,6 +918,9 @@ class MxDCore(object):
         function_name, function_parameter = parameters[0], parameters[1]
         verify_object_property(lom_object, function_name, self.epii_version)
         note_dicts = self._get_list_of_note_dictionaries(function_parameter)
+        if isinstance(note_dicts, dict):
+            self._apply_note_column_modifications(device_id, object_id, lom_object, function_name, note_dicts)
+            return
         try:
             id_to_note_mapping = {note["note_id"]: note for note in note_dicts}
         except KeyError:
@@ -871,6 +936,22 @@ class MxDCore(object):
         result = getattr(lom_object, function_name)(midi_notes)
         self.manager.send_message(device_id, object_id, "obj_call_result", self.str_representation_for_object(result))
 
+    def _apply_note_column_modifications(self, device_id, object_id, lom_object, function_name, columns):
+        if "note_id" not in columns:
+            raise RuntimeError(NOTE_ID_MISSING_ERROR)
+        names, rows = note_columns_to_rows(columns)
+        id_index = names.index("note_id")
+        id_to_row_mapping = dict(((row[id_index], row) for row in rows))
+        modified_properties = [(index, name) for index, name in enumerate(names) if name != "note_id"]
+        midi_notes = lom_object.get_notes_by_id(id_to_row_mapping.keys())
+        for midi_note in midi_notes:
+            row = id_to_row_mapping[midi_note.note_id]
+            for index, property_name in modified_properties:
+                setattr(midi_note, property_name, row[index])
+
+        result = getattr(lom_object, function_name)(midi_notes)
+        self.manager.send_message(device_id, object_id, "obj_call_result", self.str_representation_for_object(result))
+
     def _object_duplicate_notes_by_id_handler(self, device_id, object_id, lom_object, parameters):
         function_name, function_parameters = parameters[0], parameters[1[:None]]
         verify_object_property(lom_object, function_name, self.epii_version)
@@ -1157,6 +1238,7 @@ class MxDCore(object):
                             self._print_warning(device_id, object_id, "property should be listenable")
 
     def _observer_id_callback(self, device_id, object_id):
+        self._invalidate_resolved_paths()
         object_context = self.device_contexts[device_id][object_id]
         current_object = self._get_current_lom_object(device_id, object_id)
         self._goto_path(device_id, object_id, self._get_object_path(device_id, current_object))
@@ -5,10 +5,13 @@
 # Compiled at: 2024-03-09 01:30:22
 # Size of source mod 2**32: 1246 bytes
 from __future__ import absolute_import, print_function, unicode_literals
+from operator import attrgetter
 MIDI_NOTE_ATTRS = ('note_id', 'pitch', 'start_time', 'duration', 'velocity', 'mute',
                    'probability', 'velocity_deviation', 'release_velocity')
 REQUIRED_MIDI_NOTE_ATTRS = ('pitch', 'start_time', 'duration')
 VALID_DUPLICATE_NOTES_BY_ID_PARAMETERS = ('note_ids', 'destination_time', 'transposition_amount')
+COLUMNS_FORMAT = "columns"
+UNEQUAL_COLUMNS_ERROR = "All note columns must have the same length"
 
 def midi_note_to_dict(note, properties_to_return=None):
 
@@ -30,6 +33,31 @@ def midi_notes_to_notes_dict(notes):
     return {"notes": [midi_note_to_dict(note) for note in notes]}
 
 
+def midi_notes_to_columns(notes, properties_to_return=None):
+    columns = {}
+    for attr in MIDI_NOTE_ATTRS:
+        if properties_to_return is None or attr in properties_to_return:
+            column = list(map(attrgetter(attr), notes))
+            if attr == "mute":
+                column = list(map(int, column))
+            columns[attr] = column
+
+    return columns
+
+
+def slice_note_columns(columns, start, stop):
+    return dict(((attr, column[start:stop]) for attr, column in columns.items()))
+
+
+def note_columns_to_rows(columns):
+    names = list(columns.keys())
+    column_values = [columns[name] for name in names]
+    if len(set(map(len, column_values))) > 1:
+        raise RuntimeError(UNEQUAL_COLUMNS_ERROR)
+    return (
+     names, list(zip(*column_values)))
+
+
 def verify_note_specification_requirements(note_specification):
     missing_keys = set(REQUIRED_MIDI_NOTE_ATTRS) - set(note_specification.keys())
     if len(missing_keys) > 0:
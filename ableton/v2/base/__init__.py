@@ -13,12 +13,12 @@ from .gcutil import histogram, instances_by_name, refget
 from .isclose import isclose
 from .live_api_utils import duplicate_clip_loop, is_parameter_bipolar, liveobj_changed, liveobj_valid, move_current_song_time
 from .proxy import Proxy, ProxyBase
-from .util import PY2, PY3, Bindable, BooleanContext, NamedTuple, OutermostOnlyContext, Slicer, aggregate_contexts, chunks, clamp, compose, const, dict_diff, find_if, first, flatten, forward_property, get_slice, group, in_range, index_if, infinite_context_manager, instance_decorator, is_contextmanager, is_iterable, is_matrix, lazy_attribute, linear, maybe, memoize, mixin, monkeypatch, monkeypatch_extend, negate, next, nop, old_hasattr, old_round, overlaymap, print_message, product, recursive_map, remove_if, second, sign, slice_size, slicer, third, to_slice, trace_value, union
+from .util import PY2, PY3, Bindable, BooleanContext, NamedTuple, OutermostOnlyContext, PrefixTree, Slicer, aggregate_contexts, bounded_memoize, chunks, clamp, compose, const, dict_diff, find_if, first, flatten, forward_property, get_slice, group, in_range, index_if, infinite_context_manager, instance_decorator, is_contextmanager, is_iterable, is_matrix, lazy_attribute, linear, maybe, memoize, mixin, monkeypatch, monkeypatch_extend, negate, next, nop, old_hasattr, old_round, overlaymap, print_message, product, recursive_map, remove_if, second, sign, slice_size, slicer, third, to_slice, trace_value, union
 __all__ = ('Bindable', 'BooleanContext', 'CompoundDisconnectable', 'DependencyError',
            'Disconnectable', 'Event', 'EventError', 'EventObject', 'MultiSlot', 'NamedTuple',
-           'ObservablePropertyAlias', 'OutermostOnlyContext', 'Proxy', 'ProxyBase',
+           'ObservablePropertyAlias', 'OutermostOnlyContext', 'PrefixTree', 'Proxy', 'ProxyBase',
            'PY2', 'PY3', 'SerializableListenableProperties', 'Signal', 'Slicer',
-           'Slot', 'SlotGroup', 'aggregate_contexts', 'chunks', 'clamp', 'compose',
+           'Slot', 'SlotGroup', 'aggregate_contexts', 'bounded_memoize', 'chunks', 'clamp', 'compose',
            'const', 'depends', 'dict_diff', 'disconnectable', 'duplicate_clip_loop',
            'find_if', 'first', 'flatten', 'forward_property', 'get_slice', 'group',
            'has_event', 'histogram', 'in_range', 'index_if', 'infinite_context_manager',
@@ -128,12 +128,14 @@ class Slot(Disconnectable):
     def __init__(self, subject=None, listener=None, event_name=None, extra_kws=None, extra_args=None, *a, **k):
         (super(Slot, self).__init__)(*a, **k)
         self._event_name = event_name
-        if extra_kws is not None:
-            self._extra_kws = extra_kws
-        if extra_args is not None:
-            self._extra_args = extra_args
+        self._extra_kws = extra_kws if extra_kws is not None else {}
+        self._extra_args = tuple(extra_args) if extra_args is not None else ()
         self._subject = None
         self._listener = None
+        self._listener_args = (None,)
+        self._add_method = None
+        self._remove_method = None
+        self._has_method = None
         self.subject = subject
         self.listener = listener
 
@@ -148,10 +150,10 @@ class Slot(Disconnectable):
     def connect(self):
         if not self.is_connected:
             if self.subject_valid(self._subject) and self._listener is not None:
-                add_method = getattr(self._subject, "add_" + self._event_name + "_listener")
-                all_args = tuple(self._extra_args) + (self._listener,)
+                if self._add_method is None:
+                    self._bind_subject_methods(self._subject)
                 try:
-                    add_method(*all_args, **self._extra_kws)
+                    (self._add_method)(*self._listener_args, **self._extra_kws)
                 except RuntimeError:
                     pass
 
@@ -159,24 +161,35 @@ class Slot(Disconnectable):
         if self.is_connected:
             if self.subject_valid(self._subject):
                 if self._listener is not None:
-                    all_args = tuple(self._extra_args) + (self._listener,)
-                    remove_method = getattr(self._subject, "remove_" + self._event_name + "_listener")
                     try:
-                        remove_method(*all_args)
+                        (self._remove_method)(*self._listener_args)
                     except RuntimeError:
                         pass
 
     @property
     def is_connected(self):
-        all_args = tuple(self._extra_args) + (self._listener,)
         connected = False
         try:
-            connected = bool(self.subject_valid(self._subject) and self._listener is not None and (getattr(self._subject, self._event_name + "_has_listener"))(*all_args))
+            if self.subject_valid(self._subject) and self._listener is not None:
+                if self._has_method is None:
+                    self._bind_subject_methods(self._subject)
+                connected = bool((self._has_method)(*self._listener_args))
         except RuntimeError:
             pass
 
         return connected
 
+    def _bind_subject_methods(self, subject):
+        if self.subject_valid(subject):
+            event_name = self._event_name
+            self._add_method = getattr(subject, "add_" + event_name + "_listener")
+            self._remove_method = getattr(subject, "remove_" + event_name + "_listener")
+            self._has_method = getattr(subject, event_name + "_has_listener")
+        else:
+            self._add_method = None
+            self._remove_method = None
+            self._has_method = None
+
     @property
     def subject(self):
         return self._subject
@@ -188,6 +201,7 @@ class Slot(Disconnectable):
                 validate_event_interface(subject, self._event_name)
             self.soft_disconnect()
             self._subject = subject
+            self._bind_subject_methods(subject)
             self.connect()
 
     @property
@@ -199,6 +213,7 @@ class Slot(Disconnectable):
         if listener != self._listener:
             self.soft_disconnect()
             self._listener = listener
+            self._listener_args = self._extra_args + (listener,)
             self.connect()
 
     def __call__(self, *a, **k):
@@ -206,6 +221,18 @@ class Slot(Disconnectable):
             return (self._listener)(*a, **k)
 
 
+class IdentifiedListener(object):
+    __slots__ = ('_group', 'identifier')
+
+    def __init__(self, group, identifier):
+        self._group = group
+        self.identifier = identifier
+
+    def __call__(self, *a, **k):
+        listener = self._group.listener
+        return listener and listener(*a + (self.identifier,), **k)
+
+
 class SlotGroup(EventObject):
     listener = None
     _extra_kws = None
@@ -215,6 +242,7 @@ class SlotGroup(EventObject):
         (super(SlotGroup, self).__init__)(*a, **k)
         self.listener = listener
         self._event_name = event_name
+        self._slots_by_subject = {}
         if listener is not None:
             self.listener = listener
         if extra_kws is not None:
@@ -222,26 +250,69 @@ class SlotGroup(EventObject):
         if extra_args is not None:
             self._extra_args = extra_args
 
+    def disconnect(self):
+        self._slots_by_subject = {}
+        super(SlotGroup, self).disconnect()
+
     def replace_subjects(self, subjects, identifiers=repeat(None)):
-        self.disconnect()
-        for subject, identifier in zip(subjects, identifiers):
-            self.add_subject(subject, identifier=identifier)
+        subjects_and_identifiers = list(zip(subjects, identifiers))
+        try:
+            self._reuse_subject_slots(subjects_and_identifiers)
+        except TypeError:
+            self.disconnect()
+            for subject, identifier in subjects_and_identifiers:
+                self.add_subject(subject, identifier=identifier)
+
+    def _reuse_subject_slots(self, subjects_and_identifiers):
+        old_slots = self._slots_by_subject
+        new_slots = {}
+        for subject, identifier in subjects_and_identifiers:
+            if identifier is None:
+                identifier = subject
+            slots = old_slots.get(subject)
+            if slots:
+                slot = slots.pop()
+                slot.listener.identifier = identifier
+            else:
+                slot = self._register_subject_slot(subject, identifier)
+            new_slots.setdefault(subject, []).append(slot)
+
+        kept_slots = set((id(slot) for slots in new_slots.values() for slot in slots))
+        stale_slots = [slot for slot in self._registered_disconnectables if id(slot) not in kept_slots]
+        self._registered_disconnectables = [slot for slot in self._registered_disconnectables if id(slot) in kept_slots]
+        self._slots_by_subject = new_slots
+        for slot in stale_slots:
+            slot.disconnect()
 
     def add_subject(self, subject, identifier=None):
         if identifier is None:
             identifier = subject
-        listener = self._listener_for_subject(identifier)
-        self.register_slot(subject, listener, self._event_name, self._extra_kws, self._extra_args)
+        slot = self._register_subject_slot(subject, identifier)
+        try:
+            self._slots_by_subject.setdefault(subject, []).append(slot)
+        except TypeError:
+            pass
 
     def remove_subject(self, subject):
         slot = self.find_disconnectable(lambda x: x.subject == subject)
+        try:
+            slots = self._slots_by_subject.get(subject, [])
+            if slot in slots:
+                slots.remove(slot)
+        except TypeError:
+            pass
+
         self.disconnect_disconnectable(slot)
 
     def has_subject(self, subject):
         return liveobj_valid(self.find_disconnectable(lambda x: x.subject == subject))
 
+    def _register_subject_slot(self, subject, identifier):
+        listener = self._listener_for_subject(identifier)
+        return self.register_slot(subject, listener, self._event_name, self._extra_kws, self._extra_args)
+
     def _listener_for_subject(self, identifier):
-        return (lambda *a, **k: self.listener and (self.listener)(*a + (identifier,), **k))
+        return IdentifiedListener(self, identifier)
 
     def __call__(self, *a, **k):
         return (self.listener)(*a, **k)
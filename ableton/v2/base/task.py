@@ -8,6 +8,9 @@ from __future__ import absolute_import, print_function, unicode_literals
 from builtins import filter, map
 from past.utils import old_div
 import functools, logging, traceback
+from bisect import bisect
+from heapq import heappop, heappush, merge
+from itertools import count as count_from
 from .dependency import depends
 from .util import const, find_if
 from .util import linear as linear_fn
@@ -23,6 +26,9 @@ RUNNING = 1
 PAUSED = 2
 
 class Task(object):
+    _sleep_entry = None
+    _task_order = 0
+    _sequence_parent = None
 
     def __init__(self, *a, **k):
         (super(Task, self).__init__)(*a, **k)
@@ -39,6 +45,12 @@ class Task(object):
     def do_restart(self):
         pass
 
+    def sleep_ticks(self):
+        return 0
+
+    def advance_ticks(self, ticks):
+        pass
+
     def add_next(self, task):
         self._next.append(task)
         return task
@@ -49,21 +61,25 @@ class Task(object):
         return self._state
 
     def pause(self):
+        self._wake()
         if self._state != KILLED:
             self._state = PAUSED
         return self
 
     def resume(self):
+        self._wake()
         if self._state != KILLED:
             self._state = RUNNING
         return self
 
     def toggle_pause(self):
+        self._wake()
         if self._state != KILLED:
             self._state = RUNNING if self._state == PAUSED else PAUSED
         return self
 
     def restart(self):
+        self._wake()
         self.do_restart()
         self._state = RUNNING
         if self._task_manager:
@@ -74,6 +90,7 @@ class Task(object):
         return self
 
     def kill(self):
+        self._wake()
         self._state = KILLED
         if self._task_manager:
             for task in self._next:
@@ -110,6 +127,17 @@ class Task(object):
     def _task_equivalent(self, other):
         return self == other
 
+    def _wake(self):
+        sleeping = []
+        task = self
+        while task is not None:
+            if task._sleep_entry is not None:
+                sleeping.append(task)
+            task = task._task_manager or task._sequence_parent
+
+        for task in reversed(sleeping):
+            task._task_manager._wake_task(task)
+
 
 class WrapperTask(Task):
 
@@ -199,8 +227,9 @@ class TaskGroup(Task):
     auto_kill = True
     auto_remove = True
     loop = False
+    sleep_scheduling = False
 
-    def __init__(self, tasks=[], auto_kill=None, auto_remove=None, loop=None, *a, **k):
+    def __init__(self, tasks=[], auto_kill=None, auto_remove=None, loop=None, sleep_scheduling=None, *a, **k):
         (super(TaskGroup, self).__init__)(*a, **k)
         if auto_kill is not None:
             self.auto_kill = auto_kill
@@ -208,29 +237,54 @@ class TaskGroup(Task):
             self.auto_remove = auto_remove
         if loop is not None:
             self.loop = loop
+        if sleep_scheduling is not None:
+            self.sleep_scheduling = sleep_scheduling
         self._tasks = []
+        self._sleeping_tasks = []
+        self._sleeping_count = 0
+        self._sleep_sequence = count_from()
+        self._tick = 0
+        self._in_update = False
+        self._woken_in_update = False
         for task in tasks:
             self.add(task)
 
     def clear(self):
-        for t in self._tasks:
+        self._wake()
+        for t in self._all_tasks():
+            t._sleep_entry = None
             t._set_parent(None)
 
         self._tasks = []
+        self._sleeping_tasks = []
+        self._sleeping_count = 0
         super(TaskGroup, self).clear()
 
     @depends(traceback=(const(traceback)))
     def do_update(self, timer, traceback=None):
         super(TaskGroup, self).do_update(timer)
-        for task in self._tasks:
-            if not task.is_killed:
-                try:
-                    task.update(timer)
-                except Exception:
-                    task.kill()
-                    logger.error("Error when executing task")
-                    traceback.print_exc()
-
+        self._tick += 1
+        self._in_update = True
+        try:
+            if self._sleeping_count:
+                self._wake_due_tasks()
+            for task in self._tasks:
+                if not task.is_killed:
+                    try:
+                        task.update(timer)
+                    except Exception:
+                        task.kill()
+                        logger.error("Error when executing task")
+                        traceback.print_exc()
+
+        finally:
+            self._in_update = False
+
+        if self._woken_in_update:
+            self._woken_in_update = False
+            self._tasks.sort(key=_task_order_key)
+        if self.sleep_scheduling:
+            self._put_tasks_to_sleep()
         if self.auto_remove:
             self._tasks = remove_if((lambda t: t.is_killed), self._tasks)
         all_killed = len(list(filter((lambda t: t.is_killed), self._tasks))) == self.count
@@ -244,26 +298,127 @@ class TaskGroup(Task):
     def add(self, task):
         task = totask(task)
         task._set_parent(self)
+        if self.sleep_scheduling:
+            if isinstance(task, TaskGroup):
+                task.sleep_scheduling = True
+        self._wake()
+        task._task_order = next(self._sleep_sequence)
         self._tasks.append(task)
         if self.is_killed:
             super(TaskGroup, self).restart()
         return task
 
     def remove(self, task):
-        self._tasks.remove(task)
+        if task._sleep_entry is not None:
+            self._unschedule(task)
+        else:
+            self._tasks.remove(task)
         task._set_parent(None)
 
     def find(self, task):
-        return find_if((lambda t: t._task_equivalent(task)), self._tasks)
+        return find_if((lambda t: t._task_equivalent(task)), self._all_tasks())
 
     def restart(self):
         super(TaskGroup, self).restart()
-        for x in self._tasks:
+        for x in self._all_tasks():
             x.restart()
 
     @property
     def count(self):
-        return len(self._tasks)
+        return len(self._tasks) + self._sleeping_count
+
+    @property
+    def sleeping_count(self):
+        return self._sleeping_count
+
+    def sleep_ticks(self):
+        ticks = None
+        for task in self._tasks:
+            if task.is_running:
+                task_ticks = task.sleep_ticks()
+                if task_ticks <= 0:
+                    return 0
+                ticks = task_ticks if ticks is None else min(ticks, task_ticks)
+
+        wake_tick = self._next_wake_tick()
+        if wake_tick is not None:
+            sleeping_ticks = wake_tick - self._tick - 1
+            ticks = sleeping_ticks if ticks is None else min(ticks, sleeping_ticks)
+        return max(0, ticks or 0)
+
+    def advance_ticks(self, ticks):
+        self._tick += ticks
+        for task in self._tasks:
+            if task.is_running:
+                task.advance_ticks(ticks)
+
+    def _next_wake_tick(self):
+        sleeping_tasks = self._sleeping_tasks
+        while sleeping_tasks and sleeping_tasks[0][2] is None:
+            heappop(sleeping_tasks)
+
+        if sleeping_tasks:
+            return sleeping_tasks[0][0]
+
+    def _all_tasks(self):
+        if not self._sleeping_count:
+            return tuple(self._tasks)
+        return tuple(self._tasks) + tuple((entry[2] for entry in self._sleeping_tasks if entry[2] is not None))
+
+    def _put_tasks_to_sleep(self):
+        awake_tasks = []
+        for task in self._tasks:
+            ticks = task.sleep_ticks() if task.is_running else 0
+            if ticks > 0:
+                entry = [
+                 self._tick + ticks + 1, next(self._sleep_sequence), task, self._tick]
+                task._sleep_entry = entry
+                heappush(self._sleeping_tasks, entry)
+                self._sleeping_count += 1
+            else:
+                awake_tasks.append(task)
+
+        self._tasks = awake_tasks
+
+    def _wake_due_tasks(self):
+        sleeping_tasks = self._sleeping_tasks
+        woken_tasks = []
+        while sleeping_tasks and sleeping_tasks[0][0] <= self._tick:
+            task = heappop(sleeping_tasks)[2]
+            if task is not None:
+                self._advance_sleeping_task(task)
+                woken_tasks.append(task)
+
+        if woken_tasks:
+            woken_tasks.sort(key=_task_order_key)
+            self._tasks = list(merge(self._tasks, woken_tasks, key=_task_order_key))
+
+    def _unschedule(self, task):
+        entry = task._sleep_entry
+        entry[2] = None
+        task._sleep_entry = None
+        self._sleeping_count -= 1
+        return entry
+
+    def _advance_sleeping_task(self, task):
+        entry = self._unschedule(task)
+        skipped_ticks = self._tick - entry[3]
+        if self._in_update:
+            skipped_ticks -= 1
+        task.advance_ticks(skipped_ticks)
+
+    def _wake_task(self, task):
+        self._advance_sleeping_task(task)
+        if self._in_update:
+            self._woken_in_update = True
+            self._tasks.append(task)
+        else:
+            orders = [t._task_order for t in self._tasks]
+            self._tasks.insert(bisect(orders, task._task_order), task)
+
+
+def _task_order_key(task):
+    return task._task_order
 
 
 class WaitTask(Task):
@@ -305,6 +460,14 @@ class DelayTask(Task):
             self.kill()
             self.remaining = 0
 
+    def sleep_ticks(self):
+        if self.is_running:
+            return max(0, self.remaining - 1)
+        return 0
+
+    def advance_ticks(self, ticks):
+        self.remaining -= ticks
+
 
 class TimerTask(WaitTask):
 
@@ -362,6 +525,7 @@ class SequenceTask(Task):
     def _advance_sequence(self):
         try:
             self._current = next(self._iter)
+            self._current._sequence_parent = self
         except StopIteration:
             self.kill()
 
@@ -379,6 +543,15 @@ class SequenceTask(Task):
         self._iter = iter(self._tasks)
         self._advance_sequence()
 
+    def sleep_ticks(self):
+        if self._current is not None:
+            return self._current.sleep_ticks()
+        return 0
+
+    def advance_ticks(self, ticks):
+        if self._current is not None:
+            self._current.advance_ticks(ticks)
+
 
 class TimedCallbackTask(SequenceTask):
     _callback = nop
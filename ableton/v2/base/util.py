@@ -8,7 +8,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 from future.builtins import map, range
 from future.moves.itertools import zip_longest
 from future.utils import iteritems
-import sys
+import sys, weakref
+from collections import OrderedDict
 from contextlib import contextmanager
 from functools import partial, reduce, wraps
 from itertools import chain
@@ -93,6 +94,59 @@ def memoize(function):
     return wrapper
 
 
+def bounded_memoize(size, weak_keys=False):
+    assert size > 0
+
+    def decorator(function):
+        memoized = OrderedDict()
+        stats = {'hits':0,  'misses':0,  'evictions':0}
+
+        def forget(dead_ref):
+            for key in [key for key in memoized if key[0] is dead_ref]:
+                del memoized[key]
+
+        def make_key(args, on_miss=False):
+            if weak_keys:
+                if args:
+                    try:
+                        ref = weakref.ref(args[0], forget) if on_miss else weakref.ref(args[0])
+                        return (ref, args[1:])
+                    except TypeError:
+                        pass
+            return (None, args)
+
+        @wraps(function)
+        def wrapper(*args):
+            key = make_key(args)
+            try:
+                ret = memoized[key]
+            except KeyError:
+                stats['misses'] += 1
+                ret = function(*args)
+                if len(memoized) >= size:
+                    memoized.popitem(last=False)
+                    stats['evictions'] += 1
+                memoized[make_key(args, on_miss=True)] = ret
+            else:
+                stats['hits'] += 1
+                memoized.move_to_end(key)
+            return ret
+
+        def cache_info():
+            return dict(stats, size=(len(memoized)), maxsize=size)
+
+        def cache_clear():
+            memoized.clear()
+            for name in stats:
+                stats[name] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
 @memoize
 def mixin(*args):
     if len(args) == 1:
@@ -514,6 +568,44 @@ class overlaymap(object):
             yield (key, self[key])
 
 
+class PrefixTree(object):
+    _ENTRY = None
+
+    def __init__(self, items=(), *a, **k):
+        (super(PrefixTree, self).__init__)(*a, **k)
+        self._root = {}
+        self._size = 0
+        for key, value in items:
+            self[key] = value
+
+    def __len__(self):
+        return self._size
+
+    def __setitem__(self, key, value):
+        node = self._root
+        for element in key:
+            node = node.setdefault(element, {})
+
+        if self._ENTRY not in node:
+            self._size += 1
+        node[self._ENTRY] = (key, value)
+
+    def clear(self):
+        self._root = {}
+        self._size = 0
+
+    def longest_prefix_item(self, sequence):
+        node = self._root
+        result = node.get(self._ENTRY)
+        for element in sequence:
+            node = node.get(element)
+            if node is None:
+                break
+            result = node.get(self._ENTRY, result)
+
+        return result
+
+
 def trace_value(value, msg='Value: '):
     print(msg, value)
     return value
@@ -23,14 +23,15 @@ from .input_control_element import MIDI_CC_TYPE, MIDI_INVALID_TYPE, MIDI_NOTE_TY
 from .internal_parameter import EnumWrappingParameter, IntegerParameter, InternalParameter, InternalParameterBase, RelativeInternalParameter, WrappingParameter, to_percentage_display
 from .layer import BackgroundLayer, CompoundLayer, Layer, LayerClient, LayerError, SimpleLayerOwner, UnhandledElementError
 from .message_scheduler import MessageScheduler
+from .midi_output_scheduler import MidiOutputScheduler
 from .midi_map import MidiMap
 from .parameter_provider import ParameterInfo, ParameterProvider, is_parameter_quantized
 from .parameter_slot_description import use
 from .percussion_instrument_finder import PercussionInstrumentFinder
-from .resource import DEFAULT_PRIORITY, CompoundResource, ExclusiveResource, PrioritizedResource, ProxyResource, Resource, SharedResource, StackingResource
+from .resource import DEFAULT_PRIORITY, CompoundResource, ExclusiveResource, OwnerChangeBatch, PrioritizedResource, ProxyResource, Resource, SharedResource, StackingResource, batched_owner_changes
 from .session_ring_selection_linking import SessionRingSelectionLinking
 from .simpler_decoration import BoolWrappingParameter, SimplerDeviceDecorator
-from .skin import Skin, SkinColorMissingError, merge_skins
+from .skin import Skin, SkinColorId, SkinColorMissingError, merge_skins, skin_color_id
 from .wavetable_decoration import WavetableDeviceDecorator, WavetableEnvelopeType, WavetableFilterType, WavetableLfoType, WavetableOscillatorType
 __all__ = ('BackgroundLayer', 'BANK_FORMAT', 'BANK_MAIN_KEY', 'BANK_PARAMETERS_KEY',
            'BankingInfo', 'BoolWrappingParameter', 'ClipCreator', 'Component', 'CompoundElement',
@@ -41,15 +42,15 @@ __all__ = ('BackgroundLayer', 'BANK_FORMAT', 'BANK_MAIN_KEY', 'BANK_PARAMETERS_K
            'InputControlElement', 'InputSignal', 'IntegerParameter', 'InternalParameter',
            'InternalParameterBase', 'Layer', 'LayerClient', 'LayerError', 'LiveObjectDecorator',
            'MessageScheduler', 'MIDI_CC_TYPE', 'MIDI_INVALID_TYPE', 'MIDI_NOTE_TYPE',
-           'MIDI_PB_TYPE', 'MIDI_SYSEX_TYPE', 'MidiMap', 'MX_MAIN_BANK_INDEX', 'NestedElementClient',
-           'NotifyingControlElement', 'NotifyingList', 'OptimizedOwnershipHandler',
+           'MIDI_PB_TYPE', 'MIDI_SYSEX_TYPE', 'MidiMap', 'MidiOutputScheduler', 'MX_MAIN_BANK_INDEX', 'NestedElementClient',
+           'NotifyingControlElement', 'NotifyingList', 'OptimizedOwnershipHandler', 'OwnerChangeBatch',
            'ParameterInfo', 'ParameterProvider', 'ParameterSlot', 'PercussionInstrumentFinder',
            'PitchParameter', 'PrioritizedResource', 'ProxyResource', 'RelativeInternalParameter',
            'Resource', 'SessionRingSelectionLinking', 'SharedResource', 'SimpleControlSurface',
-           'SimpleLayerOwner', 'SimplerDeviceDecorator', 'Skin', 'SkinColorMissingError',
+           'SimpleLayerOwner', 'SimplerDeviceDecorator', 'Skin', 'SkinColorId', 'SkinColorMissingError',
            'StackingResource', 'UnhandledElementError', 'WavetableDeviceDecorator',
            'WavetableEnvelopeType', 'WavetableFilterType', 'WavetableLfoType', 'WavetableOscillatorType',
-           'WrappingParameter', 'all_parameters', 'create_device_bank', 'device_bank_definition',
+           'WrappingParameter', 'all_parameters', 'batched_owner_changes', 'create_device_bank', 'device_bank_definition',
            'device_to_appoint', 'find_instrument_devices', 'find_instrument_meeting_requirement',
            'get_element', 'get_parameter_by_name', 'is_parameter_quantized', 'merge_skins',
-           'select_and_appoint_device', 'to_percentage_display', 'use')
+           'select_and_appoint_device', 'skin_color_id', 'to_percentage_display', 'use')
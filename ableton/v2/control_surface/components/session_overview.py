@@ -7,7 +7,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import range
 from past.utils import old_div
-from ...base import in_range, listens, liveobj_valid
+from ...base import in_range, listens, listens_group, liveobj_valid
 from ..component import Component
 
 class SessionOverviewComponent(Component):
@@ -21,9 +21,15 @@ class SessionOverviewComponent(Component):
         self._stopped_value = 100
         self._playing_value = 127
         self._selected_value = 64
+        self._tracks = ()
+        self._num_scenes = 0
+        self._playing_scene_for_track = []
+        self._playing_count_for_block = {}
         self._session_ring = session_ring
         self._SessionOverviewComponent__on_session_offset_changes.subject = self._session_ring
+        self._SessionOverviewComponent__on_session_tracks_changed.subject = self._session_ring
         self._SessionOverviewComponent__on_scene_list_changed.subject = self.song
+        self._rebuild_playing_state()
         if enable_skinning:
             self._enable_skinning()
 
@@ -35,8 +41,23 @@ class SessionOverviewComponent(Component):
 
     @listens("scenes")
     def __on_scene_list_changed(self):
+        self._rebuild_playing_state()
         self.update()
 
+    @listens("tracks")
+    def __on_session_tracks_changed(self):
+        if self._session_ring.tracks_to_use() is not self._tracks:
+            self._rebuild_playing_state()
+            self.update()
+
+    @listens_group("playing_slot_index")
+    def __on_playing_slot_index_changed(self, track_index):
+        self._update_playing_scene(track_index)
+
+    @listens_group("fired_slot_index")
+    def __on_fired_slot_index_changed(self, track_index):
+        self._update_playing_scene(track_index)
+
     def set_button_matrix(self, buttons):
         if buttons:
             buttons.reset()
@@ -62,45 +83,94 @@ class SessionOverviewComponent(Component):
         if self.is_enabled():
             self._update_matrix_buttons()
 
+    def _rebuild_playing_state(self):
+        self._tracks = self._session_ring.tracks_to_use()
+        self._num_scenes = len(self.song.scenes)
+        self._playing_scene_for_track = [-1] * len(self._tracks)
+        self._playing_count_for_block = {}
+        return_tracks = self.song.return_tracks
+        track_indices = [index for index, track in enumerate(self._tracks) if liveobj_valid(track) if track not in return_tracks]
+        subjects = [self._tracks[index] for index in track_indices]
+        self._SessionOverviewComponent__on_playing_slot_index_changed.replace_subjects(subjects, track_indices)
+        self._SessionOverviewComponent__on_fired_slot_index_changed.replace_subjects(subjects, track_indices)
+        for index in track_indices:
+            self._set_playing_scene(index, self._read_playing_scene(index))
+
+    def _read_playing_scene(self, track_index):
+        track = self._tracks[track_index]
+        if liveobj_valid(track):
+            if not track.is_foldable:
+                scene_index = track.playing_slot_index
+                if 0 <= scene_index < self._num_scenes:
+                    return scene_index
+        return -1
+
+    def _block_for_slot(self, track_index, scene_index):
+        return (
+         track_index // self._session_ring.num_tracks,
+         scene_index // self._session_ring.num_scenes)
+
+    def _set_playing_scene(self, track_index, scene_index):
+        old_scene_index = self._playing_scene_for_track[track_index]
+        if old_scene_index == scene_index:
+            return ()
+        self._playing_scene_for_track[track_index] = scene_index
+        changed_blocks = []
+        counts = self._playing_count_for_block
+        if old_scene_index >= 0:
+            block = self._block_for_slot(track_index, old_scene_index)
+            counts[block] -= 1
+            if counts[block] == 0:
+                del counts[block]
+                changed_blocks.append(block)
+        if scene_index >= 0:
+            block = self._block_for_slot(track_index, scene_index)
+            counts[block] = counts.get(block, 0) + 1
+            if counts[block] == 1:
+                changed_blocks.append(block)
+        return changed_blocks
+
+    def _update_playing_scene(self, track_index):
+        changed_blocks = self._set_playing_scene(track_index, self._read_playing_scene(track_index))
+        if self.is_enabled():
+            if self._buttons is not None:
+                for block_x, block_y in changed_blocks:
+                    self._update_block_button(block_x, block_y)
+
+    def _update_block_button(self, block_x, block_y):
+        x = block_x - self._track_bank_index * self._buttons.width()
+        y = block_y - self._scene_bank_index * self._buttons.height()
+        if in_range(x, 0, self._buttons.width()):
+            if in_range(y, 0, self._buttons.height()):
+                self._send_button_value(x, y, self._value_for_button(x, y))
+
+    def _value_for_button(self, x, y):
+        width = self._session_ring.num_tracks
+        height = self._session_ring.num_scenes
+        track_bank_offset = self._track_bank_index * self._buttons.width() * width
+        scene_bank_offset = self._scene_bank_index * self._buttons.height() * height
+        track_offset = x * width + track_bank_offset
+        scene_offset = y * height + scene_bank_offset
+        if in_range(track_offset, 0, len(self._tracks)):
+            if in_range(scene_offset, 0, self._num_scenes):
+                if self._session_ring.track_offset - track_bank_offset in range(width * (x - 1) + 1, width * (x + 1)) and self._session_ring.scene_offset - scene_bank_offset in range(height * (y - 1) + 1, height * (y + 1)):
+                    return self._selected_value
+                if self._block_for_slot(track_offset, scene_offset) in self._playing_count_for_block:
+                    return self._playing_value
+                return self._stopped_value
+        return self._empty_value
+
+    def _send_button_value(self, x, y, value):
+        if in_range(value, 0, 128):
+            self._buttons.send_value(x, y, value)
+        else:
+            self._buttons.set_light(x, y, value)
+
     def _update_matrix_buttons(self):
         if self._buttons is not None:
-            tracks = self._session_ring.tracks_to_use()
-            scenes = self.song.scenes
-            slots_registry = [None for index in range(len(scenes))]
-            width = self._session_ring.num_tracks
-            height = self._session_ring.num_scenes
             for x in range(self._buttons.width()):
                 for y in range(self._buttons.height()):
-                    value_to_send = self._empty_value
-                    track_bank_offset = self._track_bank_index * self._buttons.width() * width
-                    scene_bank_offset = self._scene_bank_index * self._buttons.height() * height
-                    track_offset = x * width + track_bank_offset
-                    scene_offset = y * height + scene_bank_offset
-                    if track_offset in range(len(tracks)):
-                        if scene_offset in range(len(scenes)):
-                            value_to_send = self._stopped_value
-                            if self._session_ring.track_offset - track_bank_offset in range(width * (x - 1) + 1, width * (x + 1)) and self._session_ring.scene_offset - scene_bank_offset in range(height * (y - 1) + 1, height * (y + 1)):
-                                value_to_send = self._selected_value
-                            else:
-                                playing = False
-                                for track in range(track_offset, track_offset + width):
-                                    for scene in range(scene_offset, scene_offset + height):
-                                        if track in range(len(tracks)) and scene in range(len(scenes)):
-                                            if not liveobj_valid(slots_registry[scene]):
-                                                slots_registry[scene] = scenes[scene].clip_slots
-                                            slot = slots_registry[scene][track] if len(slots_registry[scene]) > track else None
-                                            if liveobj_valid(slot) and slot.has_clip and slot.clip.is_playing:
-                                                value_to_send = self._playing_value
-                                                playing = True
-                                                break
-
-                                    if playing:
-                                        break
-
-                        if in_range(value_to_send, 0, 128):
-                            self._buttons.send_value(x, y, value_to_send)
-                    else:
-                        self._buttons.set_light(x, y, value_to_send)
+                    self._send_button_value(x, y, self._value_for_button(x, y))
 
     @listens("offset")
     def __on_session_offset_changes(self, track_offset, scene_offset):
@@ -94,12 +94,13 @@ class ControlElement(Disconnectable):
     canonical_parent = None
     name = ""
     optimized_send_midi = True
+    midi_barrier = False
     _has_resource = False
     _resource_type = StackingResource
     _has_task_group = False
 
     @depends(send_midi=None, register_control=None)
-    def __init__(self, name='', is_private=False, resource_type=None, optimized_send_midi=None, send_midi=None, register_control=None, *a, **k):
+    def __init__(self, name='', is_private=False, resource_type=None, optimized_send_midi=None, midi_barrier=None, send_midi=None, register_control=None, *a, **k):
         (super(ControlElement, self).__init__)(*a, **k)
         self._send_midi = send_midi
         self.name = name
@@ -108,6 +109,8 @@ class ControlElement(Disconnectable):
             self._resource_type = resource_type
         if optimized_send_midi is not None:
             self.optimized_send_midi = optimized_send_midi
+        if midi_barrier is not None:
+            self.midi_barrier = midi_barrier
         register_control(self)
 
     def disconnect(self):
@@ -115,6 +118,8 @@ class ControlElement(Disconnectable):
         super(ControlElement, self).disconnect()
 
     def send_midi(self, message):
+        if self.midi_barrier:
+            return self._send_midi(message, optimized=(self.optimized_send_midi), barrier=True)
         return self._send_midi(message, optimized=(self.optimized_send_midi))
 
     def clear_send_cache(self):
@@ -15,7 +15,7 @@ from functools import partial
 from itertools import chain
 from pickle import dumps, loads
 import Live
-from ..base import BooleanContext, EventObject, const, find_if, first, in_range, inject, lazy_attribute, liveobj_valid, old_hasattr, task
+from ..base import BooleanContext, EventObject, PrefixTree, const, find_if, first, in_range, inject, lazy_attribute, liveobj_valid, old_hasattr, task
 from . import defaults, midi
 from .control_element import OptimizedOwnershipHandler
 from .device_bank_registry import DeviceBankRegistry
@@ -23,6 +23,7 @@ from .device_provider import DeviceProvider
 from .elements import PhysicalDisplayElement
 from .input_control_element import MIDI_CC_TYPE, MIDI_NOTE_TYPE, MIDI_PB_TYPE, MIDI_SYSEX_TYPE, InputControlElement, ScriptForwarding
 from .message_scheduler import MessageScheduler
+from .midi_output_scheduler import MidiOutputScheduler
 from .profile import profile
 __all__ = ('SimpleControlSurface', 'ControlSurface')
 logger = logging.getLogger(__name__)
@@ -46,6 +47,7 @@ class SimpleControlSurface(EventObject):
     __events__ = ('received_midi', 'disconnect')
     preferences_key = None
     handle_undo_steps = False
+    midi_bytes_per_tick = None
 
     def __init__(self, c_instance=None, *a, **k):
         (super(SimpleControlSurface, self).__init__)(*a, **k)
@@ -57,10 +59,11 @@ class SimpleControlSurface(EventObject):
         self._displays = []
         self._controls = []
         self._forwarding_long_identifier_registry = {}
+        self._forwarding_long_identifier_tree = PrefixTree()
         self._forwarding_registry = {}
         self._is_sending_scheduled_messages = BooleanContext()
         self._remaining_scheduled_messages = []
-        self._task_group = task.TaskGroup(auto_kill=False)
+        self._task_group = task.TaskGroup(auto_kill=False, sleep_scheduling=True)
         self._in_build_midi_map = BooleanContext()
         self._suppress_requests_counter = 0
         self._rebuild_requests_during_suppression = 0
@@ -70,13 +73,18 @@ class SimpleControlSurface(EventObject):
         self._midi_message_dict = {}
         self._midi_message_list = []
         self._midi_message_count = 0
+        self._midi_barrier_counts = set()
+        self._led_frames = []
         self.mxd_midi_scheduler = MessageScheduler(self._do_send_midi, self._task_group.add(task.TimedCallbackTask()))
+        self.midi_output_scheduler = MidiOutputScheduler(send_midi=(self._do_send_midi),
+          bytes_per_tick=(self.midi_bytes_per_tick))
         self._ownership_handler = OptimizedOwnershipHandler()
         self._control_surface_injector = inject(element_ownership_handler=(const(self._ownership_handler)),
           parent_task_group=(const(self._task_group)),
           show_message=(const(self.show_message)),
           register_component=(const(self._register_component)),
           register_control=(const(self._register_control)),
+          register_led_frame=(const(self._led_frames.append)),
           request_rebuild_midi_map=(const(self.request_rebuild_midi_map)),
           set_pad_translations=(const(self.set_pad_translations)),
           send_midi=(const(self._send_midi)),
@@ -121,6 +129,7 @@ class SimpleControlSurface(EventObject):
         self._controls = None
         self._displays = None
         self._pad_translations = None
+        self.midi_output_scheduler.clear()
         cs_list = get_control_surfaces()
         if self in cs_list:
             cs_list.remove(self)
@@ -162,6 +171,7 @@ class SimpleControlSurface(EventObject):
                 if isinstance(control, InputControlElement):
                     control.install_connections(self._translate_message, partial(self._install_mapping, midi_map_handle), partial(self._install_forwarding, midi_map_handle))
 
+            self._forwarding_long_identifier_tree = PrefixTree(iteritems(self._forwarding_long_identifier_registry))
             if self._pad_translations is not None:
                 self._c_instance.set_pad_translation(self._pad_translations)
 
@@ -181,6 +191,7 @@ class SimpleControlSurface(EventObject):
 
     @profile
     def update_display(self):
+        self.midi_output_scheduler.start_tick()
         with self.component_guard():
             self.update_display_hook()
             with self._is_sending_scheduled_messages():
@@ -235,7 +246,7 @@ class SimpleControlSurface(EventObject):
             result = self.get_registry_entry_for_sysex_midi_message(midi_bytes)
             if result is not None:
                 identifier, recipient = result
-                midi_processor(recipient, midi_bytes[len(identifier)[:-1]])
+                midi_processor(recipient, midi_bytes[len(identifier):-1])
             elif self.received_midi_listener_count() == 0:
                 logger.warning("Got unknown sysex message: " + midi.pretty_print_bytes(midi_bytes))
         else:
@@ -252,7 +263,7 @@ class SimpleControlSurface(EventObject):
             return self._forwarding_registry[forwarding_key]
 
     def get_registry_entry_for_sysex_midi_message(self, midi_bytes):
-        return find_if((lambda identifier_recipient: midi_bytes[None[:len(identifier_recipient[0])]] == identifier_recipient[0]), iteritems(self._forwarding_long_identifier_registry))
+        return self._forwarding_long_identifier_tree.longest_prefix_item(midi_bytes)
 
     @contextmanager
     def suppressing_rebuild_requests(self):
@@ -376,30 +387,48 @@ class SimpleControlSurface(EventObject):
     def get_component_by_name(self, component_name):
         return find_if((lambda c: c.name == component_name), self.components)
 
-    def _send_midi(self, midi_event_bytes, optimized=True):
+    def _send_midi(self, midi_event_bytes, optimized=True, barrier=False):
         if self._accumulate_midi_messages:
             sysex_status_byte = 240
             entry = (self._midi_message_count, midi_event_bytes)
-            if optimized and midi_event_bytes[0] != sysex_status_byte:
+            if optimized and not barrier and midi_event_bytes[0] != sysex_status_byte:
                 key = (
                  midi_event_bytes[0], midi_event_bytes[1])
                 self._midi_message_dict[key] = entry
             else:
                 self._midi_message_list.append(entry)
+                if barrier:
+                    self._midi_barrier_counts.add(self._midi_message_count)
             self._midi_message_count += 1
+        elif self.midi_output_scheduler.is_budgeted:
+            self.midi_output_scheduler.enqueue(midi_event_bytes, optimized=optimized, barrier=barrier)
+            self.midi_output_scheduler.send_pending()
         else:
             self._do_send_midi(midi_event_bytes)
         return True
 
     def _flush_midi_messages(self):
-        sorted_messages = sorted((chain(self._midi_message_list, itervalues(self._midi_message_dict))),
-          key=first)
-        for _, message in sorted_messages:
-            self._do_send_midi(message)
+        for led_frame in self._led_frames:
+            led_frame.flush()
+
+        scheduler = self.midi_output_scheduler
+        if scheduler.is_budgeted:
+            listed_messages = ((count, message, False) for count, message in self._midi_message_list)
+            coalesced_messages = ((count, message, True) for count, message in itervalues(self._midi_message_dict))
+            for count, message, optimized in sorted((chain(listed_messages, coalesced_messages)), key=first):
+                scheduler.enqueue(message, optimized=optimized, barrier=(count in self._midi_barrier_counts))
+
+            scheduler.send_pending()
+        else:
+            sorted_messages = sorted((chain(self._midi_message_list, itervalues(self._midi_message_dict))),
+              key=first)
+            for _, message in sorted_messages:
+                self._do_send_midi(message)
 
         self._midi_message_dict.clear()
         self._midi_message_list[None[:None]] = []
         self._midi_message_count = 0
+        self._midi_barrier_counts.clear()
 
     def _do_send_midi(self, midi_event_bytes):
         try:
@@ -6,7 +6,7 @@
 # Size of source mod 2**32: 6834 bytes
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import filter
-from ..base import EventObject, clamp, find_if, listenable_property, listens, listens_group, liveobj_valid, old_hasattr
+from ..base import EventObject, clamp, listenable_property, listens, listens_group, liveobj_valid, old_hasattr
 from .banking_util import BANK_FORMAT, BANK_MAIN_KEY, BANK_PARAMETERS_KEY, all_parameters
 
 class DeviceParameterBank(EventObject):
@@ -18,6 +18,7 @@ class DeviceParameterBank(EventObject):
         self._banking_info = banking_info
         self._index = 0
         self._parameters = None
+        self._parameters_by_original_name = None
         self._on_parameters_changed.subject = device
         self._update_parameters()
 
@@ -46,9 +47,22 @@ class DeviceParameterBank(EventObject):
 
     @listens("parameters")
     def _on_parameters_changed(self):
+        self._invalidate_parameter_index()
         self._index = self._adjust_index(self._index)
         self._update_parameters()
 
+    def _invalidate_parameter_index(self):
+        self._parameters_by_original_name = None
+
+    def _parameter_by_original_name(self, original_name):
+        if self._parameters_by_original_name is None:
+            index = {}
+            for parameter in self._device.parameters:
+                index.setdefault(parameter.original_name, parameter)
+
+            self._parameters_by_original_name = index
+        return self._parameters_by_original_name.get(original_name)
+
     @listenable_property
     def parameters(self):
         return self._parameters
@@ -85,7 +99,9 @@ class DescribedDeviceParameterBank(DeviceParameterBank):
     def __init__(self, device=None, banking_info=None, *a, **k):
         self._definition = banking_info.device_bank_definition(device)
         self._dynamic_slots = []
-        (super(DescribedDeviceParameterBank, self).__init__)(a, device=device, banking_info=banking_info, **k)
+        self._dynamic_slots_need_setup = True
+        self._name_observed_parameters = None
+        (super(DescribedDeviceParameterBank, self).__init__)(*a, device=device, banking_info=banking_info, **k)
         self._update_parameters()
 
     @listens_group("content")
@@ -98,12 +114,21 @@ class DescribedDeviceParameterBank(DeviceParameterBank):
     def _content_slots(self):
         return self._current_parameter_slots()
 
+    def _invalidate_parameter_index(self):
+        super(DescribedDeviceParameterBank, self)._invalidate_parameter_index()
+        self._dynamic_slots_need_setup = True
+
     def _setup_dynamic_slots(self):
+        dynamic_slots = list(filter((lambda s: old_hasattr(s, "notify_content")), self._content_slots()))
+        if not self._dynamic_slots_need_setup:
+            if dynamic_slots == self._dynamic_slots:
+                return
+        self._dynamic_slots_need_setup = False
         for slot in self._dynamic_slots:
             slot.set_parameter_host(None)
             self.unregister_disconnectable(slot)
 
-        self._dynamic_slots = list(filter((lambda s: old_hasattr(s, "notify_content")), self._content_slots()))
+        self._dynamic_slots = dynamic_slots
         for slot in self._dynamic_slots:
             self.register_disconnectable(slot)
             slot.set_parameter_host(self.device)
@@ -114,11 +139,10 @@ class DescribedDeviceParameterBank(DeviceParameterBank):
         return self._definition.key_by_index(self.index)
 
     def _collect_parameters(self):
-        parameters = self._device.parameters
         bank_slots = self._current_parameter_slots()
 
         def _collect_parameter(slot_definition):
-            parameter = find_if((lambda p: p.original_name == str(slot_definition)), parameters)
+            parameter = self._parameter_by_original_name(str(slot_definition))
             display_name_transformer = getattr(slot_definition, "display_name_transformer", None)
             return parameter and (
              parameter,
@@ -130,7 +154,10 @@ class DescribedDeviceParameterBank(DeviceParameterBank):
     def _update_parameters(self):
         self._setup_dynamic_slots()
         super(DescribedDeviceParameterBank, self)._update_parameters()
-        self._on_parameter_name_changed.replace_subjects([parameter for parameter, name in self._parameters])
+        parameters = [parameter for parameter, name in self._parameters]
+        if parameters != self._name_observed_parameters:
+            self._name_observed_parameters = parameters
+            self._on_parameter_name_changed.replace_subjects(parameters)
 
     @listens_group("name")
     def _on_parameter_name_changed(self, parameter):
@@ -13,6 +13,7 @@ from .combo import ComboElement, DoublePressContext, DoublePressElement, EventEl
 from .display_data_source import DisplayDataSource, adjust_string, adjust_string_crop
 from .encoder import EncoderElement, FineGrainWithModifierEncoderElement, TouchEncoderElement, TouchEncoderElementBase
 from .full_velocity_element import FullVelocityElement, NullFullVelocity
+from .led_frame import LedFrame
 from .logical_display_segment import LogicalDisplaySegment
 from .optional import ChoosingElement, OptionalElement
 from .physical_display import DisplayElement, DisplayError, DisplaySegmentationError, PhysicalDisplayElement, SubDisplayElement
@@ -26,7 +27,7 @@ __all__ = ('AnimatedColor', 'ButtonElement', 'ButtonElementMixin', 'ButtonValue'
            'ON_VALUE', 'ButtonMatrixElement', 'ButtonSliderElement', 'ComboElement',
            'DoublePressContext', 'DoublePressElement', 'EventElement', 'FullVelocityElement',
            'MultiElement', 'ToggleElement', 'WrapperElement', 'adjust_string', 'adjust_string_crop',
-           'DisplayDataSource', 'EncoderElement', 'FineGrainWithModifierEncoderElement',
+           'DisplayDataSource', 'EncoderElement', 'LedFrame', 'FineGrainWithModifierEncoderElement',
            'TouchEncoderElement', 'TouchEncoderElementBase', 'LogicalDisplaySegment',
            'ChoosingElement', 'OptionalElement', 'DisplayElement', 'DisplayError',
            'DisplaySegmentationError', 'NullFullVelocity', 'NullPlayhead', 'NullVelocityLevels',
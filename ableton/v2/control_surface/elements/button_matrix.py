@@ -17,6 +17,7 @@ class ButtonMatrixElement(CompoundElement):
         self._orig_buttons = []
         self._button_coordinates = {}
         self._max_row_width = 0
+        self._led_frame = None
         for row in rows:
             self.add_row(row)
 
@@ -35,10 +36,22 @@ class ButtonMatrixElement(CompoundElement):
             self._button_coordinates[button] = (
              index, len(self._buttons) - 1)
             self.register_control_element(button)
+            if self._led_frame is not None:
+                button.led_frame = self._led_frame
 
         if self._max_row_width < len(buttons):
             self._max_row_width = len(buttons)
 
+    def set_led_frame(self, led_frame):
+        if led_frame is not None:
+            if not led_frame.is_registered:
+                led_frame = None
+        self._led_frame = led_frame
+        for row in self._orig_buttons:
+            for button in row:
+                if button is not None:
+                    button.led_frame = led_frame
+
     def width(self):
         return self._max_row_width
 
@@ -0,0 +1,57 @@
+from __future__ import absolute_import, print_function, unicode_literals
+from collections import OrderedDict
+from ...base import const, depends
+
+class LedFrame(object):
+    min_frame_size = 2
+
+    @depends(send_midi=None, register_led_frame=(const(None)))
+    def __init__(self, encode_frame=None, send_midi=None, register_led_frame=None, *a, **k):
+        (super(LedFrame, self).__init__)(*a, **k)
+        self._encode_frame = encode_frame
+        self._send_midi = send_midi
+        self._pending_messages = OrderedDict()
+        self.frames_sent = 0
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self._is_registered = register_led_frame is not None
+        if self._is_registered:
+            register_led_frame(self)
+
+    @property
+    def is_registered(self):
+        return self._is_registered
+
+    @property
+    def pending_count(self):
+        return len(self._pending_messages)
+
+    def add(self, status, identifier, value):
+        key = (status, identifier)
+        self._pending_messages.pop(key, None)
+        self._pending_messages[key] = (status, identifier, value)
+
+    def clear(self):
+        self._pending_messages.clear()
+
+    def flush(self):
+        if self._pending_messages:
+            messages = list(self._pending_messages.values())
+            self._pending_messages.clear()
+            frames = None
+            if self._encode_frame is not None:
+                if len(messages) >= self.min_frame_size:
+                    frames = self._encode_frame(messages)
+            if frames is None:
+                for message in messages:
+                    self._send(message)
+
+            else:
+                for frame in frames:
+                    self._send(frame)
+                    self.frames_sent += 1
+
+    def _send(self, message):
+        self.messages_sent += 1
+        self.bytes_sent += len(message)
+        self._send_midi(message)
@@ -127,6 +127,7 @@ class InputControlElement(NotifyingControlElement):
     _input_signal_listener_count = 0
     num_delayed_messages = 1
     allow_receiving_chunks = False
+    led_frame = None
 
     @depends(request_rebuild_midi_map=(const(nop)))
     def __init__(self, msg_type=None, channel=None, identifier=None, sysex_identifier=None, request_rebuild_midi_map=None, send_should_depend_on_forwarding=True, is_feedback_enabled=True, *a, **k):
@@ -368,7 +369,13 @@ class InputControlElement(NotifyingControlElement):
         if self._msg_type == MIDI_PB_TYPE:
             data_byte1 = value & 127
             data_byte2 = value >> 7 & 127
-        if self.send_midi((status_byte, data_byte1, data_byte2)):
+            is_sent = self.send_midi((status_byte, data_byte1, data_byte2))
+        elif self.led_frame is not None:
+            self.led_frame.add(status_byte, data_byte1, data_byte2)
+            is_sent = True
+        else:
+            is_sent = self.send_midi((status_byte, data_byte1, data_byte2))
+        if is_sent:
             self._last_sent_message = (
              value, channel)
             if self._report_output:
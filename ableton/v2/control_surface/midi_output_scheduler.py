@@ -0,0 +1,99 @@
+from __future__ import absolute_import, print_function, unicode_literals
+from collections import OrderedDict, deque
+from ..base import nop
+from .midi import SYSEX_START
+
+class MidiOutputScheduler(object):
+
+    def __init__(self, send_midi=nop, bytes_per_tick=None, *a, **k):
+        (super(MidiOutputScheduler, self).__init__)(*a, **k)
+        self._send_midi = send_midi
+        self.bytes_per_tick = bytes_per_tick
+        self._segments = deque([self._create_segment()])
+        self._remaining_bytes = bytes_per_tick
+        self.queued_count = 0
+        self.coalesced_count = 0
+        self.dropped_count = 0
+        self.sent_count = 0
+        self.sent_bytes = 0
+
+    def __repr__(self):
+        return "MidiOutputScheduler(pending={}, queued={}, coalesced={}, dropped={})".format(self.pending_count, self.queued_count, self.coalesced_count, self.dropped_count)
+
+    @property
+    def is_budgeted(self):
+        return self.bytes_per_tick is not None
+
+    @property
+    def pending_count(self):
+        return sum((len(channel_lane) + len(sysex_lane) for channel_lane, sysex_lane in self._segments))
+
+    def enqueue(self, midi_bytes, optimized=True, barrier=False):
+        self.queued_count += 1
+        if barrier:
+            self.add_barrier()
+        channel_lane, sysex_lane = self._segments[-1]
+        if midi_bytes[0] == SYSEX_START:
+            sysex_lane.append(midi_bytes)
+        else:
+            key = (midi_bytes[0], midi_bytes[1]) if optimized else object()
+            if key in channel_lane:
+                self.coalesced_count += 1
+            channel_lane[key] = midi_bytes
+        if barrier:
+            self.add_barrier()
+
+    def add_barrier(self):
+        channel_lane, sysex_lane = self._segments[-1]
+        if channel_lane or sysex_lane:
+            self._segments.append(self._create_segment())
+
+    def start_tick(self):
+        self._remaining_bytes = self.bytes_per_tick
+
+    def send_pending(self):
+        segments = self._segments
+        while True:
+            channel_lane, sysex_lane = segments[0]
+            while channel_lane:
+                key, message = next(iter(channel_lane.items()))
+                if not self._fits_budget(message):
+                    return
+                del channel_lane[key]
+                self._send(message)
+
+            while sysex_lane:
+                if not self._fits_budget(sysex_lane[0]):
+                    return
+                self._send(sysex_lane.popleft())
+
+            if len(segments) == 1:
+                return
+            segments.popleft()
+
+    def clear(self):
+        self.dropped_count += self.pending_count
+        self._segments = deque([self._create_segment()])
+
+    @staticmethod
+    def _create_segment():
+        return (
+         OrderedDict(), deque())
+
+    def reset_counters(self):
+        self.queued_count = 0
+        self.coalesced_count = 0
+        self.dropped_count = 0
+        self.sent_count = 0
+        self.sent_bytes = 0
+
+    def _fits_budget(self, message):
+        remaining = self._remaining_bytes
+        return remaining is None or len(message) <= remaining or remaining == self.bytes_per_tick
+
+    def _send(self, message):
+        if self._remaining_bytes is not None:
+            self._remaining_bytes = max(0, self._remaining_bytes - len(message))
+        self.sent_count += 1
+        self.sent_bytes += len(message)
+        self._send_midi(message)
@@ -5,13 +5,14 @@
 # Compiled at: 2024-03-09 01:30:22
 # Size of source mod 2**32: 21350 bytes
 from __future__ import absolute_import, print_function, unicode_literals
+from contextlib import nullcontext
 from future.utils import iteritems
 from ..base import NamedTuple, depends, infinite_context_manager, is_contextmanager, is_iterable, lazy_attribute, listenable_property, listens, old_hasattr, task
 from . import defaults
 from .component import Component
 from .control import ButtonControl, ButtonControlBase, control_color
 from .layer import CompoundLayer, Layer
-from .resource import StackingResource
+from .resource import StackingResource, batched_owner_changes
 
 def tomode(thing):
     if thing is None:
@@ -347,10 +348,11 @@ class ModesComponent(Component):
     cycle_mode_button = ButtonControl()
     default_behaviour = LatchingBehaviour()
 
-    def __init__(self, enable_skinning=False, support_momentary_mode_cycling=True, *a, **k):
+    def __init__(self, enable_skinning=False, support_momentary_mode_cycling=True, batch_resource_changes=False, *a, **k):
         (super(ModesComponent, self).__init__)(*a, **k)
         self._enable_skinning = enable_skinning
         self._support_momentary_mode_cycling = support_momentary_mode_cycling
+        self._batch_resource_changes = batch_resource_changes
         self._last_toggle_value = 0
         self._mode_toggle = None
         self._mode_list = []
@@ -370,14 +372,20 @@ class ModesComponent(Component):
     def selected_mode(self, mode):
         if self.is_enabled():
             if self.selected_mode != mode:
-                if mode is not None:
-                    self.push_mode(mode)
-                    self.pop_unselected_modes()
-                else:
-                    self._mode_stack.release_all()
+                with self._resource_change_context():
+                    if mode is not None:
+                        self.push_mode(mode)
+                        self.pop_unselected_modes()
+                    else:
+                        self._mode_stack.release_all()
         else:
             self._last_selected_mode = mode
 
+    def _resource_change_context(self):
+        if self._batch_resource_changes:
+            return batched_owner_changes()
+        return nullcontext()
+
     @property
     def selected_groups(self):
         entry = self._mode_map.get(self.selected_mode, None)
@@ -390,10 +398,12 @@ class ModesComponent(Component):
         return self._mode_stack.clients
 
     def push_mode(self, mode):
-        self._mode_stack.grab(mode)
+        with self._resource_change_context():
+            self._mode_stack.grab(mode)
 
     def pop_mode(self, mode):
-        self._mode_stack.release(mode)
+        with self._resource_change_context():
+            self._mode_stack.release(mode)
 
     def pop_groups(self, groups):
         if not isinstance(groups, set):
@@ -6,8 +6,11 @@
 # Size of source mod 2**32: 9672 bytes
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import map
+from collections import OrderedDict
 from functools import partial, reduce
-from ..base import NamedTuple, Proxy, first, index_if, nop
+from heapq import heappop, heappush
+from future.utils import iteritems
+from ..base import NamedTuple, Proxy, first, nop
 DEFAULT_PRIORITY = 0
 
 class Resource(object):
@@ -130,12 +133,55 @@ class SharedResource(Resource):
         raise NotImplementedError("Override or pass callback")
 
 
+class OwnerChangeBatch(object):
+
+    def __init__(self, *a, **k):
+        (super(OwnerChangeBatch, self).__init__)(*a, **k)
+        self._depth = 0
+        self._pending = OrderedDict()
+
+    @property
+    def is_active(self):
+        return self._depth > 0
+
+    def defer(self, resource, old_owners):
+        if resource not in self._pending:
+            self._pending[resource] = old_owners
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, *a):
+        try:
+            if self._depth == 1:
+                while self._pending:
+                    pending = self._pending
+                    self._pending = OrderedDict()
+                    for resource, old_owners in iteritems(pending):
+                        resource._notify_owner_change(old_owners)
+
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._pending.clear()
+
+
+owner_change_batch = OwnerChangeBatch()
+
+def batched_owner_changes():
+    return owner_change_batch
+
+
 class StackingResource(Resource):
 
     def __init__(self, on_received_callback=None, on_lost_callback=None, *a, **k):
         (super(StackingResource, self).__init__)(*a, **k)
-        self._clients = []
-        self._owners = set()
+        self._client_priorities = {}
+        self._priority_groups = {}
+        self._priority_heap = []
+        self._heap_priorities = set()
+        self._owners = []
         if on_received_callback:
             self.on_received = on_received_callback
         if on_lost_callback:
@@ -147,12 +193,33 @@ class StackingResource(Resource):
         old_owners = self._owners
         self._remove_client(client)
         self._add_client(client, priority)
+        self._update_owners(old_owners)
+        return True
+
+    def release(self, client):
+        old_owners = self._owners
+        result = self._remove_client(client)
+        self._update_owners(old_owners)
+        return result
+
+    def release_all(self):
+        for client in self.clients:
+            self.release(client)
+
+    def _update_owners(self, old_owners):
         new_owners = self._actual_owners()
         if new_owners != old_owners:
             self._owners = new_owners
+            if owner_change_batch.is_active:
+                owner_change_batch.defer(self, old_owners)
+            else:
+                self._notify_owner_change(old_owners)
+
+    def _notify_owner_change(self, old_owners):
+        new_owners = self._owners
+        if new_owners != old_owners:
             self._on_lost_set(set(old_owners) - set(new_owners))
             self._on_received_set(new_owners)
-        return True
 
     def _on_lost_set(self, clients):
         for client in clients:
@@ -162,44 +229,53 @@ class StackingResource(Resource):
         for client in clients:
             self.on_received(client)
 
-    def release(self, client):
-        old_owners = self._owners
-        result = self._remove_client(client)
-        new_owners = self._actual_owners()
-        if new_owners != old_owners:
-            self._owners = new_owners
-            self._on_lost_set(set(old_owners) - set(new_owners))
-            self._on_received_set(new_owners)
-        return result
-
-    def release_all(self):
-        for client, _ in list(self._clients):
-            self.release(client)
-
     def _add_client(self, client, priority):
-        idx = index_if((lambda client_and_priority: client_and_priority[1] > priority), self._clients)
-        self._clients.insert(idx, (client, priority))
+        group = self._priority_groups.get(priority)
+        if group is None:
+            group = self._priority_groups[priority] = OrderedDict()
+            if priority not in self._heap_priorities:
+                self._heap_priorities.add(priority)
+                heappush(self._priority_heap, -priority)
+        group[client] = priority
+        self._client_priorities[client] = priority
 
     def _remove_client(self, client):
-        idx = index_if((lambda client_and_priority: client_and_priority[0] == client), self._clients)
-        if idx != len(self._clients):
-            del self._clients[idx]
+        if client in self._client_priorities:
+            priority = self._client_priorities.pop(client)
+            group = self._priority_groups[priority]
+            del group[client]
+            if not group:
+                del self._priority_groups[priority]
             return True
 
+    def _max_priority_group(self):
+        heap = self._priority_heap
+        while heap:
+            group = self._priority_groups.get(-heap[0])
+            if group is not None:
+                return group
+            self._heap_priorities.discard(-heappop(heap))
+
+    @property
+    def _clients(self):
+        groups = self._priority_groups
+        return [item for priority in sorted(groups) for item in iteritems(groups[priority])]
+
     def _actual_owners(self):
-        if self._clients:
-            return [self._clients[-1][0]]
+        group = self._max_priority_group()
+        if group:
+            return [next(reversed(group))]
         return []
 
     @property
     def max_priority(self):
-        if self._clients:
-            return self._clients[-1][1]
+        if self._max_priority_group():
+            return -self._priority_heap[0]
         return DEFAULT_PRIORITY
 
     @property
     def stack_size(self):
-        return len(self._clients)
+        return len(self._client_priorities)
 
     def get_owner(self):
         for owner in self._owners:
@@ -230,8 +306,7 @@ class StackingResource(Resource):
 class PrioritizedResource(StackingResource):
 
     def _actual_owners(self):
-        max_priority = self.max_priority
-        return [client for client, priority in self._clients if priority == max_priority]
+        return list(self._max_priority_group() or ())
 
 
 class ClientWrapper(NamedTuple):
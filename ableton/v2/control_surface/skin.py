@@ -18,15 +18,41 @@ class DynamicColorNotAvailableError(Exception):
     msg = "In order to use dynamic colors, you need to inject the song while creating         the skin"
 
 
+class SkinColorId(object):
+    __slots__ = ('index', 'key')
+
+    def __init__(self, index, key):
+        self.index = index
+        self.key = key
+
+    def __str__(self):
+        return self.key
+
+    def __repr__(self):
+        return "SkinColorId(%s)" % self.key
+
+
+_color_ids = {}
+
+def skin_color_id(key):
+    try:
+        return _color_ids[key]
+    except KeyError:
+        color_id = _color_ids[key] = SkinColorId(len(_color_ids), key)
+        return color_id
+
+
 class Skin(EventObject):
 
     @depends(song=(const(None)))
     def __init__(self, colors=None, song=None, *a, **k):
         (super(Skin, self).__init__)(*a, **k)
         self._colors = {}
+        self._compiled_colors = []
         self._factory_to_instance_map = {}
         if colors is not None:
             self._fill_colors(colors, song=song)
+            self.compile()
 
     def _fill_colors(self, colors, pathname='', song=None):
         if getattr(colors, "__bases__", None):
@@ -41,7 +67,21 @@ class Skin(EventObject):
                     v = self._get_dynamic_color(v, song)
                 self._colors[pathname + k] = v
 
+    def compile(self):
+        color_ids = [skin_color_id(key) for key in self._colors]
+        compiled_colors = [None] * len(_color_ids)
+        for color_id in color_ids:
+            compiled_colors[color_id.index] = self._colors[color_id.key]
+
+        self._compiled_colors = compiled_colors
+
     def __getitem__(self, key):
+        if isinstance(key, SkinColorId):
+            if key.index < len(self._compiled_colors):
+                color = self._compiled_colors[key.index]
+                if color is not None:
+                    return color
+            key = key.key
         try:
             return self._colors[key]
         except KeyError:
@@ -65,4 +105,5 @@ class Skin(EventObject):
 def merge_skins(*skins):
     skin = Skin()
     skin._colors = dict(chain(*map((lambda s: s._colors.items()), skins)))
+    skin.compile()
     return skin
@@ -5,12 +5,12 @@
 # Compiled at: 2024-03-09 01:30:22
 # Size of source mod 2**32: 1595 bytes
 from __future__ import absolute_import, print_function, unicode_literals
-from ableton.v2.base import BooleanContext, CompoundDisconnectable, Disconnectable, EventObject, MultiSlot, ObservablePropertyAlias, SlotGroup, chunks, clamp, compose, const, depends, find_if, first, flatten, forward_property, group, in_range, index_if, inject, is_iterable, lazy_attribute, listenable_property, listens, listens_group, memoize, mixin, nop, old_hasattr, product, recursive_map, sign, task
+from ableton.v2.base import BooleanContext, CompoundDisconnectable, Disconnectable, EventObject, MultiSlot, ObservablePropertyAlias, SlotGroup, bounded_memoize, chunks, clamp, compose, const, depends, find_if, first, flatten, forward_property, group, in_range, index_if, inject, is_iterable, lazy_attribute, listenable_property, listens, listens_group, memoize, mixin, nop, old_hasattr, product, recursive_map, sign, task
 from ableton.v2.base.event import EventObjectMeta
 from .util import PITCH_NAMES, as_ascii, get_default_ascii_translations, hex_to_rgb, pitch_index_to_string
 __all__ = ('PITCH_NAMES', 'BooleanContext', 'CompoundDisconnectable', 'Disconnectable',
            'EventObject', 'EventObjectMeta', 'MultiSlot', 'ObservablePropertyAlias',
-           'SlotGroup', 'as_ascii', 'chunks', 'clamp', 'compose', 'const', 'depends',
+           'SlotGroup', 'as_ascii', 'bounded_memoize', 'chunks', 'clamp', 'compose', 'const', 'depends',
            'find_if', 'first', 'flatten', 'forward_property', 'get_default_ascii_translations',
            'group', 'hex_to_rgb', 'in_range', 'index_if', 'inject', 'is_iterable',
            'lazy_attribute', 'listenable_property', 'listens', 'listens_group', 'memoize',
@@ -28,6 +28,7 @@ class LoopSelectorComponent(Component, Renderable):
     def __init__(self, name='Loop_Selector', target_track=None, sequencer_clip=None, paginator=None, *a, **k):
         (super().__init__)(a, name=name, **k)
         self._pressed_matrix_indices = []
+        self._playhead_index = None
         self._target_track = target_track
         self._LoopSelectorComponent__on_target_track_color_changed.subject = target_track
         self._clip = None
@@ -56,6 +57,8 @@ class LoopSelectorComponent(Component, Renderable):
         if liveobj_changed(clip, self._clip):
             self._LoopSelectorComponent__on_playing_position_changed.subject = clip
             self._LoopSelectorComponent__on_playing_status_changed.subject = clip
+            self._LoopSelectorComponent__on_loop_start_changed.subject = clip
+            self._LoopSelectorComponent__on_loop_end_changed.subject = clip
             self._clip = clip
             if clip:
                 if self._paginator.can_change_page:
@@ -112,7 +115,52 @@ class LoopSelectorComponent(Component, Renderable):
         self._update_matrix()
         self._update_page_buttons()
 
-    def _update_matrixParse error at or near `LOAD_FAST' instruction at offset 150
+    def _update_matrix(self):
+        self._playhead_index = self._get_playhead_index()
+        if self.is_enabled():
+            if self._has_clip():
+                state = self._matrix_state()
+                for button in self.matrix:
+                    self._refresh_matrix_button(button, state)
+
+            else:
+                for button in self.matrix:
+                    button.color = "LoopSelector.OutsideLoop"
+
+    def _update_playhead(self):
+        last_index = self._playhead_index
+        self._playhead_index = self._get_playhead_index()
+        if self._playhead_index != last_index:
+            if self.is_enabled():
+                if self._has_clip():
+                    state = self._matrix_state()
+                    for index in (last_index, self._playhead_index):
+                        if index is not None:
+                            self._refresh_matrix_button(self.matrix[index], state)
+
+    def _get_playhead_index(self):
+        if self._has_clip() and self.song.is_playing and (self._clip.is_playing or self._clip.is_recording):
+            index = int(self._clip.playing_position / self.bar_length)
+            if 0 <= index < self.matrix.control_count:
+                return index
+
+    def _matrix_state(self):
+        page_time = self._paginator.page_time
+        return (
+         self.bar_length,
+         page_time,
+         page_time + self._paginator.page_length,
+         self._clip.loop_start,
+         self._clip.loop_end)
+
+    def _refresh_matrix_button(self, button, state):
+        bar_length, page_start, page_end, loop_start, loop_end = state
+        bar_start = button.index * bar_length
+        bar_end = bar_start + bar_length
+        self._update_matrix_button(button,
+          selected=(bar_start < page_end and bar_end > page_start),
+          playing=(button.index == self._playhead_index),
+          inside_loop=(bar_start < loop_end and bar_end > loop_start))
 
     def _update_matrix_button(self, button, selected, playing, inside_loop):
         color = "OutsideLoop"
@@ -137,12 +185,20 @@ class LoopSelectorComponent(Component, Renderable):
 
     @listens("playing_position")
     def __on_playing_position_changed(self):
-        self._update_matrix()
+        self._update_playhead()
 
     @listens("playing_status")
     def __on_playing_status_changed(self):
         self._update_matrix()
 
+    @listens("loop_start")
+    def __on_loop_start_changed(self):
+        self._update_matrix()
+
+    @listens("loop_end")
+    def __on_loop_end_changed(self):
+        self._update_matrix()
+
     @listens("target_track.color")
     def __on_target_track_color_changed(self):
         self._update_matrix()
\ No newline at end of file
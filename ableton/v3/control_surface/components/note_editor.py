@@ -5,6 +5,7 @@
 # Compiled at: 2024-03-11 15:53:16
 # Size of source mod 2**32: 22487 bytes
 from __future__ import absolute_import, print_function, unicode_literals
+from bisect import bisect_left
 from math import inf
 from Live.Clip import MidiNoteSpecification
 from ...base import EventObject, clamp, depends, in_range, listenable_property, listens
@@ -19,6 +20,7 @@ DEFAULT_WIDTH = 4
 DEFAULT_VELOCITY = 100
 DEFAULT_START_NOTE = 36
 DEFAULT_STEP_TRANSLATION_CHANNEL = 1
+RANGE_TOLERANCE = 1e-06
 
 def get_notes(clip, pitches, time, length, all_pitches=False):
     if len(pitches) > 1 or all_pitches:
@@ -99,6 +101,25 @@ class TimeStep:
           self.start - self.offset, self.length)]
 
 
+class NoteIndex:
+
+    def __init__(self, notes, *a, **k):
+        (super().__init__)(*a, **k)
+        self._notes = notes
+        self._order = sorted((range(len(notes))), key=(lambda i: notes[i].start_time))
+        self._start_times = [notes[i].start_time for i in self._order]
+
+    def notes_in_range(self, start, end):
+        first = bisect_left(self._start_times, start)
+        last = bisect_left(self._start_times, end, first)
+        return [self._notes[i] for i in sorted(self._order[first:last])]
+
+    def notes_in_step(self, time_step):
+        start, length = time_step.connected_time_ranges()[0]
+        candidates = self.notes_in_range(start - RANGE_TOLERANCE, start + length + RANGE_TOLERANCE)
+        return time_step.filter_notes(candidates)
+
+
 class StepButtonControl(ButtonControl):
 
     class State(ButtonControl.State):
@@ -124,6 +145,8 @@ class NoteEditorComponent(Component):
          DEFAULT_START_NOTE]
         self._pitch_provider = PitchProvider()
         self._clip_notes = []
+        self._clip_note_index = None
+        self._page_notes_index = None
         self._clip = None
         self._sequencer_clip = sequencer_clip
         self._active_steps = []
@@ -235,8 +258,9 @@ class NoteEditorComponent(Component):
 
     def is_pitch_active(self, pitch):
         if self._has_clip():
-            for step in self.active_steps:
-                if get_notes(self._clip, (pitch,), step[0], step[1]):
+            page_notes = self._get_page_notes_index()
+            for start, end in self.active_steps:
+                if any((note.pitch == pitch for note in page_notes.notes_in_range(start, end))):
                     return True
 
         return False
@@ -253,8 +277,8 @@ class NoteEditorComponent(Component):
 
     def can_nudge_by_offset(self, offset):
         for step in self.active_steps:
-            notes = self._time_step(step[0]).filter_notes(self._clip_notes)
             time_step = self._time_step(step[0])
+            notes = self._notes_in_step(time_step)
             for note in notes:
                 new_start_time = time_step.clamp(note.start_time + offset)
                 if new_start_time != note.start_time and in_range(new_start_time, time_step.left_boundary(), time_step.right_boundary()):
@@ -267,7 +291,7 @@ class NoteEditorComponent(Component):
         if self._active_steps:
             for step in self._active_steps:
                 start_time = self._get_step_start_time(step)
-                property_ranges = property_ranges_for_notes(self._time_step(start_time).filter_notes(self._clip_notes), start_time, property_ranges)
+                property_ranges = property_ranges_for_notes(self._notes_in_step(self._time_step(start_time)), start_time, property_ranges)
 
         return property_ranges
 
@@ -297,7 +321,7 @@ class NoteEditorComponent(Component):
 
     def _get_notes_info_from_step(self, step):
         time = self._get_step_start_time(step)
-        notes = self._time_step(time).filter_notes(self._clip_notes)
+        notes = self._notes_in_step(self._time_step(time))
         pitches = [note.pitch for note in notes]
         return (time, notes, pitches)
 
@@ -305,6 +329,17 @@ class NoteEditorComponent(Component):
         return (
          self._page_time - self._time_step(0).offset, self.page_length)
 
+    def _notes_in_step(self, time_step):
+        if self._clip_note_index is None:
+            self._clip_note_index = NoteIndex(self._clip_notes)
+        return self._clip_note_index.notes_in_step(time_step)
+
+    def _get_page_notes_index(self):
+        if self._page_notes_index is None:
+            start, length = self._get_clip_notes_time_range()
+            self._page_notes_index = NoteIndex(get_notes((self._clip), (self._pitches), start, (length + self._time_step(0).offset), all_pitches=True))
+        return self._page_notes_index
+
     @matrix.pressed
     def matrix(self, pad):
         self._on_pad_pressed(pad)
@@ -381,6 +416,8 @@ class NoteEditorComponent(Component):
                 if self._has_clip():
                     if self._can_edit():
                         self._modify_step_notes(self._active_steps)
+                        self._clip_note_index = None
+                        self._page_notes_index = None
                         self._clip.apply_note_modifications(self._clip_notes)
                         self._update_editor_matrix()
                         self.notify_active_steps()
@@ -427,7 +464,7 @@ class NoteEditorComponent(Component):
         color = "NoteEditor.StepDisabled"
         if self._has_clip():
             if index in visible_steps:
-                notes = visible_steps[index].filter_notes(self._clip_notes)
+                notes = self._notes_in_step(visible_steps[index])
                 color = "NoteEditor.StepEmpty"
                 if len(notes) > 0:
                     if any((n.mute for n in notes)):
@@ -446,6 +483,8 @@ class NoteEditorComponent(Component):
     @listens("notes")
     def __on_clip_notes_changed(self):
         self._clip_notes = []
+        self._clip_note_index = None
+        self._page_notes_index = None
         if self._has_clip():
             if self._can_edit():
                 start, length = self._get_clip_notes_time_range()
@@ -39,6 +39,9 @@ class Display(Disconnectable):
         self._was_updated_in_deferred_context = False
         self._exception_raised = False
         self._suppress_stdout_from_render = True
+        self.render_requests = 0
+        self.renders_performed = 0
+        self.renders_skipped = 0
         self._state = State()
         for component in renderable_components:
             if component.include_in_top_level_state:
@@ -73,9 +76,11 @@ class Display(Disconnectable):
             self._display_fn(content)
 
     def render_and_update_display(self):
+        self.render_requests += 1
         try:
             if self._is_deferring_render_and_update:
                 self._was_updated_in_deferred_context = True
+                self.renders_skipped += 1
             else:
                 if self._display_fn:
                     captured_stdout = StringIO()
@@ -84,7 +89,10 @@ class Display(Disconnectable):
                     if content != self._last_displayed_content:
                         self.display(content)
                         self._last_displayed_content = content
+                        self.renders_performed += 1
                         self._suppress_stdout_from_render = False
+                    else:
+                        self.renders_skipped += 1
                     if not self._suppress_stdout_from_render:
                         last_output = captured_stdout.getvalue()
                         if last_output:
@@ -115,6 +123,17 @@ class Display(Disconnectable):
     def rendered_content(self):
         return self._last_displayed_content
 
+    @property
+    def render_statistics(self):
+        return dict(requested=(self.render_requests),
+          performed=(self.renders_performed),
+          skipped=(self.renders_skipped))
+
+    def reset_render_statistics(self):
+        self.render_requests = 0
+        self.renders_performed = 0
+        self.renders_skipped = 0
+
     def disconnect(self):
         self.react(DISCONNECT_EVENT)
 
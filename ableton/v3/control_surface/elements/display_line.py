@@ -18,13 +18,14 @@ class DisplayLineElement(NotifyingControlElement, Generic[DisplayDataType]):
         self._formatting_fn = formatting_fn
         self._default_formatting = default_formatting
         self._last_native_content = None
+        self._last_displayed_output = None
 
     def display_message(self, text):
         if updating_display:
             if self._last_native_content != text:
                 self._last_native_content = text
                 if not self.grabbed:
-                    self._do_display(text)
+                    self._do_display(text, skip_unchanged_output=True)
         else:
             self._do_display(text)
 
@@ -34,10 +35,13 @@ class DisplayLineElement(NotifyingControlElement, Generic[DisplayDataType]):
         if text.justification is None:
             text.justification = self._default_formatting.justification
 
-    def _do_display(self, message: Union[(Text, str)]):
+    def _do_display(self, message: Union[(Text, str)], skip_unchanged_output=False):
         text = message if isinstance(message, Text) else Text(message)
         self._apply_default_formatting(text)
-        self._display_fn(self._formatting_fn(text))
+        output = self._formatting_fn(text)
+        if not skip_unchanged_output or output != self._last_displayed_output:
+            self._last_displayed_output = output
+            self._display_fn(output)
 
     @property
     def grabbed(self):
@@ -45,6 +49,7 @@ class DisplayLineElement(NotifyingControlElement, Generic[DisplayDataType]):
 
     def clear_send_cache(self):
         self._last_native_content = None
+        self._last_displayed_output = None
 
     def reset(self):
         if self.grabbed:
@@ -5,11 +5,11 @@
 # Compiled at: 2024-03-09 01:30:22
 # Size of source mod 2**32: 3943 bytes
 from __future__ import absolute_import, print_function, unicode_literals
-from itertools import chain
+from functools import partial
 import Live
-from ..base import depends, listenable_property, listens_group
-from ..live import liveobj_changed
-from . import Component, find_instrument_devices, find_instrument_meeting_requirement
+from ..base import depends, find_if, listenable_property, listens_group
+from ..live import liveobj_changed, liveobj_valid
+from . import Component, find_instrument_meeting_requirement
 from .display import Renderable
 
 def find_drum_group_device(track_or_chain):
@@ -20,12 +20,36 @@ def find_drum_group_device(track_or_chain):
     return find_instrument_meeting_requirement(requirement, track_or_chain)
 
 
+def is_sliced_simpler(instrument):
+    return getattr(instrument, "playback_mode", None) == Live.SimplerDevice.PlaybackMode.slicing
+
+
 def find_sliced_simpler(track_or_chain):
+    return find_instrument_meeting_requirement(is_sliced_simpler, track_or_chain)
 
-    def requirement(instrument):
-        return getattr(instrument, "playback_mode", None) == Live.SimplerDevice.PlaybackMode.slicing
 
-    return find_instrument_meeting_requirement(requirement, track_or_chain)
+class ChainInstruments:
+
+    def __init__(self, track_or_chain=None, *a, **k):
+        (super().__init__)(*a, **k)
+        self.devices = []
+        self.racks = []
+        self.simplers = []
+        self.chains = [track_or_chain] if track_or_chain is not None else []
+        self.drum_group = None
+        self.sliced_simpler = None
+        self.is_volatile = False
+
+    def add_chain(self, other):
+        self.devices.extend(other.devices)
+        self.racks.extend(other.racks)
+        self.simplers.extend(other.simplers)
+        self.chains.extend(other.chains)
+        if self.drum_group is None:
+            self.drum_group = other.drum_group
+        if self.sliced_simpler is None:
+            self.sliced_simpler = other.sliced_simpler
+        self.is_volatile = self.is_volatile or other.is_volatile
 
 
 class InstrumentFinderComponent(Component, Renderable):
@@ -38,50 +62,100 @@ class InstrumentFinderComponent(Component, Renderable):
     def __init__(self, name='Instrument_Finder', target_track=None, *a, **k):
         (super().__init__)(a, name=name, **k)
         self._target_track = target_track
-        self.register_slot(target_track, self.update, "target_track")
+        self._chain_cache = {}
+        self._listened_subjects = None
+        self.register_slot(target_track, self._on_target_track_changed, "target_track")
+        self.update()
+
+    def _on_target_track_changed(self):
+        self._chain_cache = {}
         self.update()
 
     @listens_group("devices")
-    def __on_devices_changed(self, _):
+    def __on_devices_changed(self, track_or_chain):
+        self._invalidate_chains(track_or_chain)
         self.update()
 
     @listens_group("chains")
-    def __on_chains_changed(self, _):
+    def __on_chains_changed(self, rack):
+        self._invalidate_chains(rack)
         self.update()
 
     @listens_group("playback_mode")
-    def __on_slicing_changed(self, _):
+    def __on_slicing_changed(self, simpler):
+        self._invalidate_chains(simpler)
         self.update()
 
     def update(self):
         super().update()
         if self.is_enabled():
-            self._update_listeners()
-            self._update_instruments()
-
-    def _update_listeners(self):
-        track = self._target_track.target_track
-        devices = list(find_instrument_devices(track))
-        racks = list(filter((lambda d: d.can_have_chains), devices))
-        simplers = list(filter((lambda d: hasattr(d, "playback_mode")), devices))
-        chains = list(chain([track], *[d.chains for d in racks]))
-        self._InstrumentFinderComponent__on_chains_changed.replace_subjects(racks)
-        self._InstrumentFinderComponent__on_devices_changed.replace_subjects(chains)
-        self._InstrumentFinderComponent__on_slicing_changed.replace_subjects(simplers)
-
-    def _update_instruments(self):
-        track = self._target_track.target_track
+            instruments = self._instruments_in(self._target_track.target_track)
+            self._prune_chain_cache(instruments)
+            self._update_listeners(instruments)
+            self._update_instruments(instruments)
+
+    def _invalidate_chains(self, lom_object):
+        while liveobj_valid(lom_object):
+            self._chain_cache.pop(lom_object._live_ptr, None)
+            lom_object = lom_object.canonical_parent
+
+    def _prune_chain_cache(self, instruments):
+        pointers = set((c._live_ptr for c in instruments.chains if liveobj_valid(c)))
+        self._chain_cache = {k: v for k, v in self._chain_cache.items() if k in pointers}
+
+    def _instruments_in(self, track_or_chain, use_cache=True):
+        if not liveobj_valid(track_or_chain):
+            return ChainInstruments()
+        instruments = self._chain_cache.get(track_or_chain._live_ptr) if use_cache else None
+        if instruments is None or instruments.is_volatile:
+            instruments = self._collect_instruments(track_or_chain, use_cache)
+            if use_cache:
+                self._chain_cache[track_or_chain._live_ptr] = instruments
+        return instruments
+
+    def _collect_instruments(self, track_or_chain, use_cache):
+        instruments = ChainInstruments(track_or_chain)
+        instrument = find_if((lambda d: d.type == Live.Device.DeviceType.instrument), track_or_chain.devices)
+        if liveobj_valid(instrument):
+            instruments.devices.append(instrument)
+            if hasattr(instrument, "playback_mode"):
+                instruments.simplers.append(instrument)
+            if instrument.can_have_drum_pads:
+                instruments.drum_group = instrument
+            elif is_sliced_simpler(instrument):
+                instruments.sliced_simpler = instrument
+            if instrument.can_have_chains:
+                instruments.racks.append(instrument)
+                if instrument.can_have_drum_pads:
+                    instruments.chains.extend(instrument.chains)
+                    instruments.is_volatile = True
+                    instruments.sliced_simpler = find_if(bool, (self._instruments_in(c, use_cache=False).sliced_simpler for c in instrument.chains))
+                else:
+                    for chain_instruments in map(partial((self._instruments_in), use_cache=use_cache), instrument.chains):
+                        instruments.add_chain(chain_instruments)
+
+        return instruments
+
+    def _update_listeners(self, instruments):
+        subjects = (
+         instruments.racks, instruments.chains, instruments.simplers)
+        if subjects != self._listened_subjects:
+            self._listened_subjects = subjects
+            self._InstrumentFinderComponent__on_chains_changed.replace_subjects(instruments.racks)
+            self._InstrumentFinderComponent__on_devices_changed.replace_subjects(instruments.chains)
+            self._InstrumentFinderComponent__on_slicing_changed.replace_subjects(instruments.simplers)
+
+    def _update_instruments(self, instruments):
         do_notify = False
-        drum_group = find_drum_group_device(track)
+        drum_group = instruments.drum_group
         if liveobj_changed(drum_group, self.drum_group):
             self.drum_group = drum_group
             do_notify = True
-        sliced_simpler = find_sliced_simpler(track)
+        sliced_simpler = instruments.sliced_simpler
         if liveobj_changed(sliced_simpler, self.sliced_simpler):
             self.sliced_simpler = sliced_simpler
             do_notify = True
-        any_instrument = list(find_instrument_devices(track))
-        any_instrument = any_instrument[0] if any_instrument else None
+        any_instrument = instruments.devices[0] if instruments.devices else None
         if liveobj_changed(any_instrument, self.any_instrument):
             self.any_instrument = any_instrument
             do_notify = True
@@ -5,9 +5,10 @@
 # Compiled at: 2024-03-11 15:53:16
 # Size of source mod 2**32: 12552 bytes
 from __future__ import absolute_import, print_function, unicode_literals
+from contextlib import nullcontext
 from functools import partial
 from typing import cast
-from ableton.v2.control_surface import StackingResource
+from ableton.v2.control_surface import StackingResource, batched_owner_changes
 from ableton.v2.control_surface.mode import _ModeEntry, tomode
 from ...base import listenable_property, task
 from .. import Component
@@ -21,9 +22,10 @@ class ModesComponent(Component, Renderable):
     default_behaviour = ImmediateBehaviour()
     previous_mode = listenable_property.managed(None)
 
-    def __init__(self, name=None, support_momentary_mode_cycling=True, default_behaviour=None, is_private=False, *a, **k):
+    def __init__(self, name=None, support_momentary_mode_cycling=True, default_behaviour=None, is_private=False, batch_resource_changes=False, *a, **k):
         (super().__init__)(a, name=name, is_private=is_private, **k)
         self._support_momentary_mode_cycling = support_momentary_mode_cycling
+        self._batch_resource_changes = batch_resource_changes
         self._mode_list = []
         self._mode_map = {}
         self._last_selected_mode = None
@@ -55,14 +57,21 @@ class ModesComponent(Component, Renderable):
         if self.is_enabled():
             if self.selected_mode != mode:
                 if mode is not None:
-                    self.push_mode(mode)
-                    self.pop_unselected_modes()
+                    with self._resource_change_context():
+                        self.push_mode(mode)
+                        self.pop_unselected_modes()
                     self.notify(self.notifications.Modes.select, cast(str, self.name), cast(str, mode))
                 else:
-                    self._mode_stack.release_all()
+                    with self._resource_change_context():
+                        self._mode_stack.release_all()
         else:
             self._last_selected_mode = mode
 
+    def _resource_change_context(self):
+        if self._batch_resource_changes:
+            return batched_owner_changes()
+        return nullcontext()
+
     def get_mode(self, name):
         entry = self._mode_map.get(name, None)
         return entry and entry.mode
@@ -88,7 +97,8 @@ class ModesComponent(Component, Renderable):
 
     def _do_push_mode(self, mode):
         self._cancel_push_mode_task(mode)
-        self._mode_stack.grab(mode)
+        with self._resource_change_context():
+            self._mode_stack.grab(mode)
 
     def _cancel_push_mode_task(self, mode):
         if mode in self._push_mode_tasks:
@@ -110,7 +120,8 @@ class ModesComponent(Component, Renderable):
         self._cancel_pop_mode_task(mode)
         if len(self.active_modes) <= 1:
             return
-        self._mode_stack.release(mode)
+        with self._resource_change_context():
+            self._mode_stack.release(mode)
 
     def _cancel_pop_mode_task(self, mode):
         if mode in self._pop_mode_tasks:
@@ -6,9 +6,11 @@
 # Size of source mod 2**32: 5840 bytes
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import object, range
+from collections import OrderedDict
+from itertools import chain
 from ableton.v2.base import depends
 from ableton.v2.control_surface import MIDI_CC_TYPE, MIDI_NOTE_TYPE
-from ableton.v2.control_surface.elements import ButtonElement, ButtonMatrixElement, SliderElement, SysexElement
+from ableton.v2.control_surface.elements import ButtonElement, ButtonMatrixElement, LedFrame, SliderElement, SysexElement
 from . import sysex
 SESSION_WIDTH = 8
 SESSION_HEIGHT = 8
@@ -27,10 +29,39 @@ def create_slider(identifier, name, **k):
     return slider
 
 
+def make_led_frame_encoder(model_id):
+    header = sysex.STD_MSG_HEADER + (model_id, sysex.PRINT_COMMAND_BYTE)
+    max_specifications = sysex.MAX_LED_SPECIFICATIONS_PER_MESSAGE
+
+    def encode_frame(messages):
+        specifications = OrderedDict()
+        static_values = {}
+        for status, identifier, value in messages:
+            channel = status & 15
+            if channel == 0:
+                static_values[identifier] = value
+                specifications[identifier] = (sysex.STATIC_LIGHTING_TYPE, identifier, value)
+            elif channel == 1:
+                if identifier not in static_values:
+                    return
+                specifications[identifier] = (
+                 sysex.FLASHING_LIGHTING_TYPE, identifier, value, static_values[identifier])
+            elif channel == 2:
+                specifications[identifier] = (sysex.PULSING_LIGHTING_TYPE, identifier, value)
+            else:
+                return
+
+        specifications = list(specifications.values())
+        return [header + tuple(chain.from_iterable(specifications[index:index + max_specifications])) + (sysex.SYSEX_END_BYTE,) for index in range(0, len(specifications), max_specifications)]
+
+    return encode_frame
+
+
 class LaunchpadElements(object):
     model_id = 0
     default_layout = 0
     button_fader_cc_offset = 0
+    use_led_frames = False
 
     def __init__(self, arrow_button_identifiers=(91, 92, 93, 94), session_mode_button_identifier=95, *a, **k):
         (super(LaunchpadElements, self).__init__)(*a, **k)
@@ -45,11 +76,14 @@ class LaunchpadElements(object):
           name="Scene_Launch_Buttons")
         self.clip_launch_matrix = ButtonMatrixElement(rows=[[create_button((offset + col_index), ("{}_Clip_Launch_Button_{}".format(col_index, row_index)), msg_type=MIDI_NOTE_TYPE) for col_index in range(SESSION_WIDTH)] for row_index, offset in enumerate(range(81, 10, -10))],
           name="Clip_Launch_Matrix")
+        if self.use_led_frames:
+            self.clip_launch_matrix.set_led_frame(LedFrame(encode_frame=(make_led_frame_encoder(self.model_id))))
         self.firmware_mode_switch = SysexElement(name="Firmware_Mode_Switch",
           send_message_generator=(lambda v: sysex.STD_MSG_HEADER + (
          self.model_id, sysex.FIRMWARE_MODE_COMMAND_BYTE, v, sysex.SYSEX_END_BYTE)),
           default_value=(sysex.STANDALONE_MODE_BYTE),
-          optimized=True)
+          optimized=True,
+          midi_barrier=True)
         layout_switch_identifier = sysex.STD_MSG_HEADER + (
          self.model_id,
          sysex.LAYOUT_COMMAND_BYTE)
@@ -57,7 +91,8 @@ class LaunchpadElements(object):
           sysex_identifier=layout_switch_identifier,
           send_message_generator=(lambda v: layout_switch_identifier + (v if type(v) is tuple else (v,)) + (sysex.SYSEX_END_BYTE,)),
           default_value=(self.default_layout),
-          enquire_message=(layout_switch_identifier + (sysex.SYSEX_END_BYTE,)))
+          enquire_message=(layout_switch_identifier + (sysex.SYSEX_END_BYTE,)),
+          midi_barrier=True)
 
     def _create_scale_feedback_switch(self):
         self.scale_feedback_switch = SysexElement(name="Scale_Feedback_Switch",
@@ -31,3 +31,7 @@ FADER_VERTICAL_ORIENTATION = 0
 FADER_HORIZONTAL_ORIENTATION = 1
 FADER_UNIPOLAR = 0
 FADER_BIPOLAR = 1
+STATIC_LIGHTING_TYPE = 0
+FLASHING_LIGHTING_TYPE = 1
+PULSING_LIGHTING_TYPE = 2
+MAX_LED_SPECIFICATIONS_PER_MESSAGE = 81
@@ -7,13 +7,13 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 from builtins import filter, map, object, range
 from past.utils import old_div
-from bisect import bisect
+from bisect import bisect, bisect_left, bisect_right
 from contextlib import contextmanager
 from functools import cmp_to_key, partial
 from itertools import chain, product
 import Live
 from ableton.v2.base import EventObject, clamp, first, in_range, index_if, listenable_property, listens, liveobj_changed, liveobj_valid, sign, task
-from ableton.v2.control_surface import Component, defaults
+from ableton.v2.control_surface import Component, defaults, skin_color_id
 from ableton.v2.control_surface.control import ButtonControl, PlayableControl, control_matrix
 from .loop_selector_component import create_clip_in_selected_slot
 from .matrix_maps import PLAYHEAD_FEEDBACK_CHANNELS
@@ -27,12 +27,18 @@ DEFAULT_VELOCITY_RANGE_THRESHOLDS = [
 VELOCITY_RANGE_INDEX_TO_COLOR = ["Full", "High", "Low"]
 BEAT_TIME_EPSILON = 1e-05
 
-def color_for_note(note, velocity_range_thresholds=None):
+NOTE_COLORS = VELOCITY_RANGE_INDEX_TO_COLOR + ["Muted"]
+MUTED_NOTE_COLOR_INDEX = len(VELOCITY_RANGE_INDEX_TO_COLOR)
+
+def color_index_for_note(note, velocity_range_thresholds=None):
     thresholds = velocity_range_thresholds or DEFAULT_VELOCITY_RANGE_THRESHOLDS
     if not note.mute:
-        velocity_range_index = index_if((lambda threshold: note.velocity >= threshold), thresholds)
-        return VELOCITY_RANGE_INDEX_TO_COLOR[velocity_range_index]
-    return "Muted"
+        return index_if((lambda threshold: note.velocity >= threshold), thresholds)
+    return MUTED_NOTE_COLOR_INDEX
+
+
+def color_for_note(note, velocity_range_thresholds=None):
+    return NOTE_COLORS[color_index_for_note(note, velocity_range_thresholds)]
 
 
 def most_significant_note(notes):
@@ -92,6 +98,26 @@ class TimeStep(object):
           self.start - self.offset, self.length)]
 
 
+class TimeIndexedNotes(object):
+
+    def __init__(self, notes=(), *a, **k):
+        (super(TimeIndexedNotes, self).__init__)(*a, **k)
+        entries = sorted((enumerate(notes)),
+          key=(lambda entry: (entry[1].start_time, entry[1].pitch, entry[0])))
+        self._start_times = [note.start_time for _, note in entries]
+        self._entries = entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def filter_notes(self, time_step):
+        lower_bound = time_step.start - time_step.offset - BEAT_TIME_EPSILON
+        upper_bound = lower_bound + time_step.length + 2 * BEAT_TIME_EPSILON
+        candidates = self._entries[bisect_left(self._start_times, lower_bound):bisect_right(self._start_times, upper_bound)]
+        candidates.sort(key=(lambda entry: entry[0]))
+        return [note for _, note in candidates if time_step.includes_note(note)]
+
+
 class NullVelocityProvider(EventObject):
 
     @listenable_property
@@ -165,6 +191,7 @@ class NoteEditorComponent(Component):
         self._get_notes_handler = get_notes_handler
         self._remove_notes_handler = remove_notes_handler
         self._skin_base_key = skin_base_key
+        self._compile_step_colors()
         self.full_velocity = False
         self._provided_velocity = None
         self._selected_page_point = 0
@@ -180,6 +207,7 @@ class NoteEditorComponent(Component):
         self._modify_all_notes_enabled = False
         self._step_tap_tasks = {}
         self._clip_notes = []
+        self._clip_note_index = None
         self._pitches = [
          DEFAULT_START_NOTE]
         self._grid_resolution = grid_resolution
@@ -217,7 +245,7 @@ class NoteEditorComponent(Component):
              TimeStep(0.0, ONE_YEAR_AT_120BPM_IN_BEATS)]
         else:
             time_steps = [self._time_step(self.get_step_start_time(start_time)) for start_time in chain(self._pressed_steps, self._modified_steps)]
-        time_steps_with_notes = [time_step.filter_notes(self._clip_notes) for time_step in time_steps]
+        time_steps_with_notes = list(map(self._notes_in_time_step, time_steps))
         notes_in_step = []
         for time_step in time_steps_with_notes:
             for note in time_step:
@@ -314,6 +342,22 @@ class NoteEditorComponent(Component):
         return (
          time_start - self._time_step(0).offset, time_length)
 
+    @property
+    def background_color(self):
+        return self._background_color
+
+    @background_color.setter
+    def background_color(self, color):
+        self._background_color = color
+        self._background_color_id = skin_color_id(color)
+
+    def _compile_step_colors(self):
+        base_key = self._skin_base_key
+        self._step_color_ids = [skin_color_id(base_key + ".Step." + color) for color in NOTE_COLORS]
+        self._step_editing_color_ids = [skin_color_id(base_key + ".StepEditing." + color) for color in NOTE_COLORS]
+        self._step_selected_color_id = skin_color_id(base_key + ".StepSelected")
+        self._step_disabled_color_id = skin_color_id(base_key + ".StepDisabled")
+
     @listens("notes")
     def _on_clip_notes_changed(self):
         if liveobj_valid(self._sequencer_clip) and self._can_edit():
@@ -321,12 +365,18 @@ class NoteEditorComponent(Component):
             self._clip_notes = self._get_notes_handler(self._sequencer_clip, time_start, self._pitches, time_length)
         else:
             self._clip_notes = []
+        self._clip_note_index = None
         self._update_editor_matrix()
         self.notify_notes_changed()
 
+    def _notes_in_time_step(self, time_step):
+        if self._clip_note_index is None:
+            self._clip_note_index = TimeIndexedNotes(self._clip_notes)
+        return self._clip_note_index.filter_notes(time_step)
+
     def _update_editor_matrix(self):
         step_colors = [
-         self._skin_base_key + ".StepDisabled"] * self._get_step_count()
+         self._step_disabled_color_id] * self._get_step_count()
 
         def coords_to_index(coord):
             return coord[0] + coord[1] * self._get_width()
@@ -335,28 +385,28 @@ class NoteEditorComponent(Component):
         selected_indices = set(map(coords_to_index, self._pressed_steps))
         last_editing_notes = []
         for time_step, index in self._visible_steps():
-            notes = time_step.filter_notes(self._clip_notes)
+            notes = self._notes_in_time_step(time_step)
             if len(notes) > 0:
                 last_editing_notes = []
                 if index in selected_indices:
-                    color = self._skin_base_key + ".StepSelected"
+                    color = self._step_selected_color_id
                 else:
                     if index in editing_indices:
-                        note_color = self._determine_color(notes)
-                        color = self._skin_base_key + ".StepEditing." + note_color
+                        note_color = self._determine_color_index(notes)
+                        color = self._step_editing_color_ids[note_color]
                         last_editing_notes = notes
                     else:
-                        note_color = self._determine_color(notes)
-                        color = self._skin_base_key + ".Step." + note_color
+                        note_color = self._determine_color_index(notes)
+                        color = self._step_color_ids[note_color]
             else:
                 if any(map(time_step.overlaps_note, last_editing_notes)):
-                    color = self._skin_base_key + ".StepEditing." + note_color
+                    color = self._step_editing_color_ids[note_color]
                 else:
                     if index in editing_indices or index in selected_indices:
-                        color = self._skin_base_key + ".StepSelected"
+                        color = self._step_selected_color_id
                         last_editing_notes = []
                     else:
-                        color = self.background_color
+                        color = self._background_color_id
                         last_editing_notes = []
             step_colors[index] = color
 
@@ -367,6 +417,10 @@ class NoteEditorComponent(Component):
         return color_for_note((most_significant_note(notes)),
           velocity_range_thresholds=(self._velocity_range_thresholds))
 
+    def _determine_color_index(self, notes):
+        return color_index_for_note((most_significant_note(notes)),
+          velocity_range_thresholds=(self._velocity_range_thresholds))
+
     def _visible_steps(self):
         first_time = self.page_length * self._page_index
         steps_per_page = self._get_step_count()
@@ -494,7 +548,7 @@ class NoteEditorComponent(Component):
             return left.start_time - right.start_time
 
         time = self.get_step_start_time(step)
-        notes = self._time_step(time).filter_notes(self._clip_notes)
+        notes = self._notes_in_time_step(self._time_step(time))
         if notes:
             beginning_note = first(sorted(notes, key=(cmp_to_key(note_compare))))
             start = beginning_note.start_time
@@ -532,7 +586,7 @@ class NoteEditorComponent(Component):
             return [self.get_step_start_time(step) for step in steps]
 
         time = self.get_step_start_time(step)
-        all_steps_with_notes = [time_step for time_step, index in self._visible_steps() if time_step.filter_notes(self._clip_notes)]
+        all_steps_with_notes = [time_step for time_step, index in self._visible_steps() if self._notes_in_time_step(time_step)]
         all_time_step_starts = [ts.start for ts in all_steps_with_notes]
         if all_time_step_starts:
             insert_point = bisect(all_time_step_starts, time)
@@ -545,7 +599,7 @@ class NoteEditorComponent(Component):
     def _add_step_to_duplicator(self, step):
         nudge_offset = 0
         time = self.get_step_start_time(step)
-        notes = self._time_step(time).filter_notes(self._clip_notes)
+        notes = self._notes_in_time_step(self._time_step(time))
         step_start, step_end = self._get_time_range(step)
         if notes:
             nudge_offset = min(map((lambda n: n.start_time), notes)) - time
@@ -586,7 +640,7 @@ class NoteEditorComponent(Component):
 
     def _get_notes_info_from_step(self, step):
         time = self.get_step_start_time(step)
-        notes = self._time_step(time).filter_notes(self._clip_notes)
+        notes = self._notes_in_time_step(self._time_step(time))
         pitches = [note.pitch for note in notes]
         return (time, notes, pitches)
 
@@ -716,6 +770,7 @@ class NoteEditorComponent(Component):
         self._reset_modifications()
 
     def _replace_notes(self):
+        self._clip_note_index = None
         if self._can_edit():
             time_start, time_length = self._get_clip_notes_time_range()
             self._sequencer_clip.apply_note_modifications(self._clip_notes)
@@ -775,6 +830,6 @@ class NoteEditorComponent(Component):
             min_max_values = None
             for step in chain(self._modified_steps, self._pressed_steps):
                 start_time = self.get_step_start_time(step)
-                min_max_values = min_max_for_notes(self._time_step(start_time).filter_notes(self._clip_notes), start_time, min_max_values)
+                min_max_values = min_max_for_notes(self._notes_in_time_step(self._time_step(start_time)), start_time, min_max_values)
 
             return min_max_values
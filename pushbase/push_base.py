@@ -1281,8 +1281,8 @@ class PushBase(ControlSurface):
         self._note_layout_switcher.release_alternative_layout()
         self._select_note_mode()
 
-    def _send_midi(self, midi_event_bytes, optimized=True):
-        return self._suppress_sysex and midi.is_sysex(midi_event_bytes) or super(PushBase, self)._send_midi(midi_event_bytes, optimized)
+    def _send_midi(self, midi_event_bytes, optimized=True, barrier=False):
+        return self._suppress_sysex and midi.is_sysex(midi_event_bytes) or super(PushBase, self)._send_midi(midi_event_bytes, optimized, barrier)
 
     def _update_playhead_color(self, color):
         self._instrument.playhead_color = color